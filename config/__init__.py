@@ -15,6 +15,24 @@ from .reddit_config import REDDIT_CONFIG
 from .ai_config import AI_CONFIG
 from .app_config import APP_CONFIG
 
+# Exact placeholder values shipped in the config templates, .env.template and the setup docs.
+# Matched exactly, so a real value that merely starts with "your_" is still accepted
+_PLACEHOLDERS = frozenset({
+    'YOUR_CLIENT_ID', 'YOUR_CLIENT_SECRET', 'YOUR_USERNAME', 'YOUR_PASSWORD',
+    'YOUR_CLIENT_ID_HERE', 'YOUR_CLIENT_SECRET_HERE', 'YOUR_USERNAME_HERE', 'YOUR_PASSWORD_HERE',
+    'YOUR_GEMINI_API_KEY_HERE',
+    'your_reddit_username', 'your_reddit_password',
+    'your_client_id_from_step_2', 'your_client_secret_from_step_2',
+    'your_actual_client_id_here', 'your_actual_client_secret_here',
+    'your_actual_reddit_username', 'your_actual_reddit_password',
+    'your-reddit-client-id', 'your-reddit-client-secret', 'your-reddit-username', 'your-reddit-password',
+    'your-gemini-api-key', 'your-gemini-api-key-here', 'your-actual-api-key-here'
+})
+
+def is_placeholder(value) -> bool:
+    """True if a credential is missing or still one of the template placeholders"""
+    return not value or value in _PLACEHOLDERS
+
 class Config:
     """Main configuration class"""
     
@@ -52,17 +70,13 @@ class Config:
         
         # Validate Reddit config
         reddit_config = self.get_reddit_config()
-        validation["reddit"] = all([
-            reddit_config["client_id"] and not reddit_config["client_id"].startswith("YOUR_"),
-            reddit_config["client_secret"] and not reddit_config["client_secret"].startswith("YOUR_")
-        ])
+        validation["reddit"] = not (
+            is_placeholder(reddit_config["client_id"]) or is_placeholder(reddit_config["client_secret"])
+        )
         
         # Validate AI config
         ai_config = self.get_ai_config()
-        validation["ai"] = bool(
-            ai_config["gemini_api_key"] and 
-            not ai_config["gemini_api_key"].startswith("your-")
-        )
+        validation["ai"] = not is_placeholder(ai_config["gemini_api_key"])
         
         validation["overall"] = all(validation.values())
         
@@ -76,4 +90,4 @@ REDDIT_CONFIG = config.get_reddit_config()
 AI_CONFIG = config.get_ai_config()
 APP_CONFIG = config.get_app_config()
 
-__all__ = ['config', 'REDDIT_CONFIG', 'AI_CONFIG', 'APP_CONFIG']
\ No newline at end of file
+__all__ = ['config', 'REDDIT_CONFIG', 'AI_CONFIG', 'APP_CONFIG', 'is_placeholder']
\ No newline at end of file
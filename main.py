@@ -22,7 +22,7 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 # Now we can import our modules
-from src.core import WorkflowManager
+from src.core import WorkflowManager, BusinessAnalyzer
 from config import config
 
 async def run_test_mode():
@@ -47,7 +47,8 @@ async def run_test_mode():
             reddit_client_id=reddit_config["client_id"],
             reddit_client_secret=reddit_config["client_secret"],
             reddit_username=reddit_config["username"],
-            reddit_password=reddit_config["password"]
+            reddit_password=reddit_config["password"],
+            max_concurrent_requests=config.get_app_config()["performance"]["max_concurrent_requests"]
         )
         
         # Run workflow
@@ -76,13 +77,13 @@ def run_streamlit_app():
     """Launch the Streamlit application"""
     print("🚀 Launching Reddit Marketing Bot Streamlit App...")
     
-    import subprocess
-    import sys
-    
     try:
-        # Launch the enhanced posting app
+        # Launch the enhanced posting app in this interpreter, as `streamlit run` does
+        from streamlit.web import bootstrap  # Only needed for this mode
+        
         app_path = project_root / "src" / "apps" / "enhanced_posting_app.py"
-        subprocess.run([sys.executable, "-m", "streamlit", "run", str(app_path)])
+        bootstrap.load_config_options(flag_options={})
+        bootstrap.run(str(app_path), is_hello=False, args=[], flag_options={})
     except KeyboardInterrupt:
         print("\n👋 Streamlit app stopped by user")
     except Exception as e:
@@ -93,7 +94,6 @@ async def run_analysis_mode(business_description: str):
     print("📊 Running Business Analysis Mode")
     
     try:
-        from src.core import BusinessAnalyzer
         ai_config = config.get_ai_config()
         
         analyzer = BusinessAnalyzer(ai_config["gemini_api_key"])
@@ -126,7 +126,8 @@ async def run_full_mode(business_description: str, **kwargs):
             reddit_client_id=reddit_config["client_id"],
             reddit_client_secret=reddit_config["client_secret"],
             reddit_username=reddit_config["username"],
-            reddit_password=reddit_config["password"]
+            reddit_password=reddit_config["password"],
+            max_concurrent_requests=config.get_app_config()["performance"]["max_concurrent_requests"]
         )
         
         # Run workflow with provided parameters
@@ -141,6 +142,16 @@ async def run_full_mode(business_description: str, **kwargs):
         print(f"❌ Full workflow failed: {str(e)}")
         return None
 
+def validate_and_print_config():
+    """Validate configuration and print its status"""
+    validation = config.validate_config()
+    print(f"📊 Configuration Status:")
+    print(f"   Reddit API: {'✅' if validation['reddit'] else '❌'}")
+    print(f"   AI API: {'✅' if validation['ai'] else '❌'}")
+    
+    if not validation['overall']:
+        print("⚠️  Configuration issues detected. Check your config files.")
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Reddit Marketing Bot")
@@ -156,22 +167,17 @@ def main():
     print("🤖 Reddit Marketing Bot")
     print("=" * 50)
     
-    # Validate configuration
-    validation = config.validate_config()
-    print(f"📊 Configuration Status:")
-    print(f"   Reddit API: {'✅' if validation['reddit'] else '❌'}")
-    print(f"   AI API: {'✅' if validation['ai'] else '❌'}")
+    # The Streamlit app configures itself; skip CLI validation for a faster launch
+    if args.mode == "streamlit":
+        run_streamlit_app()
+        return
     
-    if not validation['overall']:
-        print("⚠️  Configuration issues detected. Check your config files.")
+    validate_and_print_config()
     
     # Run based on mode
     if args.mode == "test":
         asyncio.run(run_test_mode())
     
-    elif args.mode == "streamlit":
-        run_streamlit_app()
-    
     elif args.mode == "analyze":
         if not args.business:
             print("❌ Business description required for analysis mode")
@@ -41,14 +41,14 @@ sys.path.insert(0, current_dir)
 # Import with error handling for Replit
 def safe_import():
     """Safely import modules with helpful error messages"""
-    global PyPDF2, RedditAnalyzer, AIResponseGenerator, BusinessAnalyzer, WorkflowManager
+    global PdfReader, RedditAnalyzer, AIResponseGenerator, BusinessAnalyzer, WorkflowManager
     missing_modules = []
     
     try:
-        import PyPDF2
+        from pypdf import PdfReader
     except ImportError:
-        missing_modules.append("PyPDF2")
-        PyPDF2 = None
+        missing_modules.append("pypdf")
+        PdfReader = None
     
     try:
         from reddit_analyzer import RedditAnalyzer
@@ -470,12 +470,12 @@ def show_analysis_tab():
                 help="Be specific about your product, target audience, and key benefits"
             )
         
-        elif PyPDF2 and input_method == "📄 PDF Upload":
+        elif PdfReader and input_method == "📄 PDF Upload":
             uploaded_file = st.file_uploader("Upload PDF", type="pdf")
             if uploaded_file:
                 business_description = extract_pdf_text(uploaded_file)
         
-        elif not PyPDF2:
+        elif not PdfReader:
             st.warning("PDF upload not available. Please use text description.")
         
         # Analysis button
@@ -507,15 +507,13 @@ Benefits: 40% reduction in stockouts, 25% decrease in excess inventory, 3-5 hour
 
 def extract_pdf_text(uploaded_file):
     """Extract text from PDF file"""
-    if not PyPDF2:
+    if not PdfReader:
         st.error("PDF processing not available")
         return ""
     
     try:
-        pdf_reader = PyPDF2.PdfReader(uploaded_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
+        pdf_reader = PdfReader(uploaded_file)
+        text = "".join(page.extract_text() or "" for page in pdf_reader.pages)
         
         if text:
             st.success(f"✅ PDF processed! Extracted {len(text)} characters.")
@@ -4,74 +4,195 @@ Quick Reddit App Type Test
 This will help diagnose if your Reddit app is configured correctly.
 """
 
-import praw
+import functools
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# prawcore/requests are imported inside the functions that use them, so
+# importing this module or bailing out on missing credentials stays cheap
 
 # Your current credentials
 CLIENT_ID = "JzMoXfHl2-vkeePH0w0qPA"
 CLIENT_SECRET = "ZUA5-WYZftqZMiNcQ0wbalCb8tzP8w"
-USER_AGENT = "RedditBot/1.0 by RedditUser"
+USER_AGENT = "python:redditbot-quicktest:1.0 (by /u/RedditUser)"
 
-def test_app_type():
-    print("Testing Reddit app configuration...")
-    print("=" * 50)
+# Public subreddit used for the probe
+SUBREDDIT = "python"
+
+# Three posts, unescaped text, no per-post subreddit objects: the smallest useful listing
+_LISTING_PARAMS = {"limit": 3, "raw_json": 1, "sr_detail": "false"}
+
+# A successful probe is trusted for this long before hitting Reddit again
+CACHE_DIR = Path.home() / ".cache" / "reddit_bot"
+CACHE_FILE = CACHE_DIR / "quick_test.json"
+CACHE_TTL = 1800
+
+# Preformatted output blocks
+_BANNER = "=" * 50
+_HEADER = f"Testing Reddit app configuration...\n{_BANNER}"
+_MSG_SUCCESS = (
+    "\n🎉 SUCCESS: Your Reddit API credentials are working!\n"
+    "Your bot should now work for read-only operations."
+)
+
+# Diagnosis for each failure we can recognise
+MSG_401 = (
+    "\n🔍 DIAGNOSIS: Invalid credentials\n"
+    "SOLUTIONS:\n"
+    "1. Double-check your client_id and client_secret\n"
+    "2. Make sure you copied them correctly from https://www.reddit.com/prefs/apps"
+)
+MSG_403 = (
+    "\n🔍 DIAGNOSIS: Access forbidden\n"
+    "SOLUTIONS:\n"
+    "1. Your app might need to be approved\n"
+    "2. Try creating a new Reddit app"
+)
+MSG_APP_TYPE = (
+    "\n🔍 DIAGNOSIS: Wrong app type\n"
+    "SOLUTIONS:\n"
+    "1. Go to https://www.reddit.com/prefs/apps\n"
+    "2. Delete your current app\n"
+    "3. Create a new one and select 'script' (not 'web app')"
+)
+MSG_UNKNOWN = (
+    "\n🔍 DIAGNOSIS: Unknown error\n"
+    "SOLUTIONS:\n"
+    "1. Check your internet connection\n"
+    "2. Verify Reddit is accessible\n"
+    "3. Try creating new credentials"
+)
+
+# Diagnosis by HTTP status of a failed response
+STATUS_TABLE = {401: MSG_401, 403: MSG_403}
+
+def _build_session():
+    """HTTP session with a larger keep-alive pool and retries on transient 5xx"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     
     try:
-        # Test read-only access (should work for both web app and script)
-        reddit = praw.Reddit(
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            user_agent=USER_AGENT
+        import requests_cache
+        # Only GETs are cached, so the token request still checks the credentials
+        session = requests_cache.CachedSession(
+            str(CACHE_DIR / "http_cache"), backend="sqlite", expire_after=CACHE_TTL
         )
-        
-        # Try to access a simple public subreddit
-        subreddit = reddit.subreddit('python')
-        print(f"✅ Basic connection successful!")
-        print(f"Subreddit: {subreddit.display_name}")
-        print(f"Subscribers: {subreddit.subscribers:,}")
-        
-        # Get a few posts to confirm API is working
-        posts = list(subreddit.hot(limit=3))
-        print(f"✅ Retrieved {len(posts)} posts successfully!")
-        
-        for i, post in enumerate(posts, 1):
-            print(f"{i}. {post.title[:60]}...")
-        
-        print("\n🎉 SUCCESS: Your Reddit API credentials are working!")
-        print("Your bot should now work for read-only operations.")
-        
-        return True
-        
-    except Exception as e:
-        error_msg = str(e)
-        print(f"❌ ERROR: {error_msg}")
-        
-        if "401" in error_msg:
-            print("\n🔍 DIAGNOSIS: Invalid credentials")
-            print("SOLUTIONS:")
-            print("1. Double-check your client_id and client_secret")
-            print("2. Make sure you copied them correctly from https://www.reddit.com/prefs/apps")
-            
-        elif "403" in error_msg:
-            print("\n🔍 DIAGNOSIS: Access forbidden")
-            print("SOLUTIONS:")
-            print("1. Your app might need to be approved")
-            print("2. Try creating a new Reddit app")
-            
-        elif "script apps" in error_msg.lower():
-            print("\n🔍 DIAGNOSIS: Wrong app type")
-            print("SOLUTIONS:")
-            print("1. Go to https://www.reddit.com/prefs/apps")
-            print("2. Delete your current app")
-            print("3. Create a new one and select 'script' (not 'web app')")
-            
-        else:
-            print(f"\n🔍 DIAGNOSIS: Unknown error")
-            print("SOLUTIONS:")
-            print("1. Check your internet connection")
-            print("2. Verify Reddit is accessible")
-            print("3. Try creating new credentials")
-        
+    except ImportError:  # HTTP response caching is optional
+        session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    ))
+    
+    try:
+        import orjson
+    except ImportError:  # Faster JSON decoding is optional
+        return session
+    
+    def use_orjson(response, *args, **kwargs):
+        """Make response.json() (what prawcore calls) decode with orjson"""
+        response.json = lambda **_: orjson.loads(response.content)
+    
+    session.hooks["response"].append(use_orjson)
+    return session
+
+@functools.lru_cache(maxsize=1)
+def _get_authorizer():
+    """Build the read-only authorizer once and reuse its connection pool and token"""
+    import prawcore
+    
+    requestor = prawcore.Requestor(USER_AGENT, session=_build_session())
+    authenticator = prawcore.TrustedAuthenticator(requestor, CLIENT_ID, CLIENT_SECRET)
+    return prawcore.ReadOnlyAuthorizer(authenticator)
+
+@functools.lru_cache(maxsize=1)
+def _get_reddit():
+    """prawcore session bound to the shared authorizer"""
+    import prawcore
+    
+    return prawcore.session(_get_authorizer())
+
+def _load_cached_success():
+    """Return True if these credentials passed the probe within CACHE_TTL"""
+    try:
+        cached = json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
         return False
+    return (
+        cached.get("ok") is True
+        and cached.get("client_id") == CLIENT_ID
+        and time.time() - cached.get("ts", 0) < CACHE_TTL
+    )
+
+def _save_success():
+    """Record a successful probe so the next run within CACHE_TTL can skip it"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps({"ok": True, "client_id": CLIENT_ID, "ts": time.time()}))
+    except OSError:
+        pass  # Caching is best-effort
+
+def _report_failure(error, diagnosis):
+    """Log a failed probe with its diagnosis; returns False for the caller"""
+    logger.error("❌ ERROR: %s", error)
+    logger.error(diagnosis)
+    return False
+
+def test_app_type():
+    logger.info(_HEADER)
+    
+    if not CLIENT_ID or not CLIENT_SECRET:
+        logger.error("❌ ERROR: CLIENT_ID and CLIENT_SECRET must be set")
+        return False
+    
+    if _load_cached_success():
+        logger.info("✅ Credentials verified recently (cached result)")
+        logger.info("Delete %s to force a live check.", CACHE_FILE)
+        return True
+    
+    import prawcore
+    
+    # Test read-only access (should work for both web app and script).
+    # The token request alone proves the credentials, so bad ones fail here
+    authorizer = _get_authorizer()
+    try:
+        if not authorizer.is_valid():
+            authorizer.refresh()
+    except prawcore.ResponseException as e:
+        return _report_failure(e, STATUS_TABLE.get(e.response.status_code, MSG_UNKNOWN))
+    except prawcore.OAuthException as e:
+        return _report_failure(e, MSG_APP_TYPE if "script apps" in str(e).lower() else MSG_401)
+    except prawcore.RequestException as e:
+        return _report_failure(e, MSG_UNKNOWN)
+    logger.info("✅ Basic connection successful!")
+    
+    # Get a few posts from a public subreddit as plain JSON (no PRAW models)
+    try:
+        listing = _get_reddit().request("GET", f"/r/{SUBREDDIT}/hot", params=_LISTING_PARAMS)
+    except prawcore.ResponseException as e:
+        return _report_failure(e, STATUS_TABLE.get(e.response.status_code, MSG_UNKNOWN))
+    except prawcore.PrawcoreException as e:
+        return _report_failure(e, MSG_UNKNOWN)
+    
+    titles = [child["data"]["title"] for child in listing["data"]["children"]]
+    logger.info("Subreddit: r/%s", SUBREDDIT)
+    logger.info("✅ Retrieved %d posts successfully!", len(titles))
+    if titles and logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join(f"{i}. {title[:60]}..." for i, title in enumerate(titles, 1)))
+    
+    logger.info(_MSG_SUCCESS)
+    
+    _save_success()
+    return True
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding="utf-8")  # Emoji-safe output on any console
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     test_app_type()
@@ -4,15 +4,27 @@ A comprehensive web application for finding relevant Reddit questions and genera
 """
 
 import streamlit as st
-import os
 import asyncio
-import pandas as pd
+import os
 from datetime import datetime
 import json
 import io
-import PyPDF2
-from typing import List, Dict, Any, Optional
+import csv
+from typing import List, Dict, Any, Optional, Tuple
 import time
+from collections import Counter
+from statistics import fmean
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    import orjson
+except ImportError:  # Faster JSON export is optional
+    orjson = None
 
 # Import our custom modules
 from reddit_analyzer import RedditAnalyzer
@@ -28,8 +40,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Display-only date strings stored on each QA when results arrive, and their formats
+_DATE_FORMATS = {'_date_short': '%Y-%m-%d', '_date_long': '%Y-%m-%d %H:%M'}
+
+# Longest business description passed on to the workflow (roughly AI max_tokens * 4 chars, with headroom)
+MAX_DESCRIPTION_CHARS = 50000
+
 # Custom CSS for better UI
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -63,26 +81,11 @@ st.markdown("""
         border-radius: 0.5rem;
         border: 1px solid #ffeaa7;
     }
-    .question-card {
-        background-color: #ffffff;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #FF4B4B;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .answer-card {
-        background-color: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #28a745;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 def main():
+    st.markdown(_CSS, unsafe_allow_html=True)
     st.markdown('<h1 class="main-header">🤖 Reddit Marketing Bot</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; color: #666; font-size: 1.2rem;">Find relevant Reddit questions and generate human-like marketing responses</p>', unsafe_allow_html=True)
     
@@ -145,16 +148,19 @@ def main():
             uploaded_file = st.file_uploader("Upload PDF document", type="pdf")
             if uploaded_file is not None:
                 try:
-                    pdf_reader = PyPDF2.PdfReader(uploaded_file)
-                    pdf_text = ""
-                    for page in pdf_reader.pages:
-                        pdf_text += page.extract_text()
+                    # Extract and truncate once per upload rather than on every rerun
+                    if st.session_state.get('pdf_file_id') != uploaded_file.file_id:
+                        pdf_text = extract_pdf_text(uploaded_file.read())
+                        st.session_state.pdf_file_id = uploaded_file.file_id
+                        st.session_state.pdf_length = len(pdf_text)
+                        st.session_state.pdf_preview = pdf_text[:2000] + ('...' if len(pdf_text) > 2000 else '')
+                        st.session_state.pdf_description = pdf_text[:MAX_DESCRIPTION_CHARS]
                     
-                    business_description = pdf_text
-                    st.success(f"PDF uploaded successfully! Extracted {len(pdf_text)} characters.")
+                    business_description = st.session_state.pdf_description
+                    st.success(f"PDF uploaded successfully! Extracted {st.session_state.pdf_length} characters.")
                     
                     with st.expander("📄 View extracted text"):
-                        st.text_area("Extracted content:", value=pdf_text[:2000] + "..." if len(pdf_text) > 2000 else pdf_text, height=200, disabled=True)
+                        st.text_area("Extracted content:", value=st.session_state.pdf_preview, height=200, disabled=True)
                         
                 except Exception as e:
                     st.error(f"Error reading PDF: {str(e)}")
@@ -200,30 +206,43 @@ def main():
     if process_button and not st.session_state.processing:
         st.session_state.processing = True
         
-        with st.spinner("🔄 Processing your request..."):
+        with st.status("🔄 Processing your request...") as status:
             try:
-                # Initialize workflow manager
-                workflow_manager = WorkflowManager(
-                    gemini_api_key=gemini_api_key,
-                    reddit_client_id=reddit_client_id,
-                    reddit_client_secret=reddit_client_secret
+                # Reuse the workflow manager for these credentials across runs
+                workflow_manager = get_workflow_manager(
+                    gemini_api_key, reddit_client_id, reddit_client_secret
                 )
                 
-                # Run the complete workflow
-                results = asyncio.run(workflow_manager.run_complete_workflow(
-                    business_description=business_description,
-                    max_questions=max_questions,
-                    subreddit_limit=subreddit_limit,
-                    response_style=response_style,
-                    include_nsfw=include_nsfw,
-                    min_upvotes=min_upvotes,
-                    days_back=days_back
-                ))
+                # Run the complete workflow off the script thread
+                results = run_in_background(
+                    lambda: run_async(workflow_manager.run_complete_workflow(
+                        business_description=business_description,
+                        max_questions=max_questions,
+                        subreddit_limit=subreddit_limit,
+                        response_style=response_style,
+                        include_nsfw=include_nsfw,
+                        min_upvotes=min_upvotes,
+                        days_back=days_back
+                    )),
+                    status
+                )
+                
+                # Format dates once so the UI and exports don't redo it per rerun
+                for qa in results.get('question_answer_pairs', []):
+                    created = datetime.fromtimestamp(qa.get('created_utc', 0))
+                    for key, date_format in _DATE_FORMATS.items():
+                        qa[key] = created.strftime(date_format)
                 
                 st.session_state.workflow_results = results
+                st.session_state.export_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                st.session_state.pop('qa_editor', None)
+                create_csv_export.clear()
+                create_json_export.clear()
                 st.session_state.business_info = results.get('business_analysis', {})
+                status.update(label="✅ Analysis complete!", state="complete")
                 
             except Exception as e:
+                status.update(label="❌ Processing failed", state="error")
                 st.error(f"Error during processing: {str(e)}")
             finally:
                 st.session_state.processing = False
@@ -232,6 +251,73 @@ def main():
     if st.session_state.workflow_results:
         display_results(st.session_state.workflow_results)
 
+def extract_pdf_text(pdf_bytes: bytes, max_workers: int = 4, parallel_threshold: int = 50) -> str:
+    """Extract text from a PDF, preferring poppler's pdftotext and falling back to PyMuPDF"""
+    pdftotext = shutil.which('pdftotext')
+    if pdftotext:
+        try:
+            with tempfile.NamedTemporaryFile(suffix='.pdf') as pdf_file:
+                pdf_file.write(pdf_bytes)
+                pdf_file.flush()
+                output = subprocess.check_output([pdftotext, '-layout', pdf_file.name, '-'], stderr=subprocess.DEVNULL)
+            return output.decode('utf-8', 'replace')
+        except (OSError, subprocess.CalledProcessError) as e:
+            st.warning(f"⚠️ pdftotext failed, falling back to PyMuPDF: {e}")
+    
+    # PyMuPDF: large documents are split into page ranges across threads
+    import fitz  # Deferred: only needed when a PDF is uploaded
+    
+    def extract_range(pages: range) -> str:
+        # Each worker opens its own document; MuPDF documents are not thread-safe
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_doc:
+            return "".join(
+                pdf_doc[i].get_text(flags=fitz.TEXT_PRESERVE_WHITESPACE) for i in pages
+            )
+    
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_doc:
+        page_count = pdf_doc.page_count
+    
+    if page_count <= parallel_threshold:
+        return extract_range(range(page_count))
+    
+    chunk_size = -(-page_count // max_workers)
+    chunks = [range(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return "".join(executor.map(extract_range, chunks))
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Start a long-lived event loop on a daemon thread, shared across reruns"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="app-loop").start()
+    return loop
+
+@st.cache_resource(show_spinner=False)
+def get_workflow_manager(gemini_api_key: str, reddit_client_id: str, reddit_client_secret: str) -> WorkflowManager:
+    """Build one WorkflowManager per set of credentials and share it across reruns"""
+    return WorkflowManager(
+        gemini_api_key=gemini_api_key,
+        reddit_client_id=reddit_client_id,
+        reddit_client_secret=reddit_client_secret
+    )
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+def run_in_background(func, status, poll_interval: float = 0.5):
+    """Run func on a worker thread while keeping the status widget updated"""
+    ctx = get_script_run_ctx()
+    started = time.monotonic()
+    
+    with ThreadPoolExecutor(max_workers=1, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        future = executor.submit(func)
+        while not future.done():
+            status.update(label=f"🔄 Processing your request... ({time.monotonic() - started:.0f}s)")
+            time.sleep(poll_interval)
+    
+    return future.result()
+
 def display_results(results: Dict[str, Any]):
     """Display the workflow results in an organized manner"""
     
@@ -269,70 +355,25 @@ def display_results(results: Dict[str, Any]):
         qa_pairs = results['question_answer_pairs']
         
         # Summary stats
+        total_questions, avg_score, total_comments, subreddit_counts = _qa_stats(qa_pairs)
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Questions Found", len(qa_pairs))
+            st.metric("Total Questions Found", total_questions)
         with col2:
-            avg_score = sum(q.get('score', 0) for q in qa_pairs) / len(qa_pairs) if qa_pairs else 0
             st.metric("Avg Question Score", f"{avg_score:.1f}")
         with col3:
-            total_comments = sum(q.get('num_comments', 0) for q in qa_pairs)
             st.metric("Total Comments", total_comments)
         with col4:
-            unique_subreddits = len(set(q.get('subreddit', '') for q in qa_pairs))
-            st.metric("Subreddits Covered", unique_subreddits)
+            st.metric("Subreddits Covered", len(subreddit_counts))
         
-        # Display each question-answer pair
-        for i, qa_pair in enumerate(qa_pairs, 1):
-            with st.container():
-                st.markdown(f"### 📋 Question {i}")
-                
-                # Question details
-                st.markdown(f"""
-                <div class="question-card">
-                    <h4>❓ {qa_pair.get('title', 'No title')}</h4>
-                    <p><strong>Subreddit:</strong> r/{qa_pair.get('subreddit', 'unknown')}</p>
-                    <p><strong>Score:</strong> {qa_pair.get('score', 0)} upvotes | <strong>Comments:</strong> {qa_pair.get('num_comments', 0)}</p>
-                    <p><strong>Created:</strong> {datetime.fromtimestamp(qa_pair.get('created_utc', 0)).strftime('%Y-%m-%d %H:%M')}</p>
-                    <p><strong>Question:</strong> {qa_pair.get('selftext', 'No question text')[:500]}{'...' if len(qa_pair.get('selftext', '')) > 500 else ''}</p>
-                    <p><strong>URL:</strong> <a href="{qa_pair.get('url', '#')}" target="_blank">View on Reddit</a></p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # AI-generated answer
-                st.markdown(f"""
-                <div class="answer-card">
-                    <h4>🤖 AI-Generated Response</h4>
-                    <p>{qa_pair.get('ai_response', 'No response generated')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Action buttons for each response
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    if st.button(f"📋 Copy Response {i}", key=f"copy_{i}"):
-                        st.code(qa_pair.get('ai_response', ''), language=None)
-                        
-                with col2:
-                    if st.button(f"✏️ Edit Response {i}", key=f"edit_{i}"):
-                        edited_response = st.text_area(
-                            f"Edit response for question {i}:",
-                            value=qa_pair.get('ai_response', ''),
-                            key=f"edit_area_{i}",
-                            height=150
-                        )
-                        qa_pair['ai_response'] = edited_response
-                        
-                with col3:
-                    if st.button(f"⭐ Save Favorite {i}", key=f"save_{i}"):
-                        save_favorite_response(qa_pair, i)
-                
-                st.markdown("---")
+        # Display all question-answer pairs in a single editable table
+        qa_table(qa_pairs)
 
     # Export options
     if st.session_state.workflow_results:
         st.markdown('<h2 class="sub-header">📤 Export Results</h2>', unsafe_allow_html=True)
         
+        export_stamp = st.session_state.get('export_stamp', '')
         col1, col2, col3 = st.columns(3)
         
         with col1:
@@ -341,17 +382,17 @@ def display_results(results: Dict[str, Any]):
                 st.download_button(
                     label="Download CSV",
                     data=csv_data,
-                    file_name=f"reddit_marketing_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"reddit_marketing_results_{export_stamp}.csv",
                     mime="text/csv"
                 )
                 
         with col2:
             if st.button("📝 Export to JSON", use_container_width=True):
-                json_data = json.dumps(st.session_state.workflow_results, indent=2, default=str)
+                json_data = create_json_export(st.session_state.workflow_results)
                 st.download_button(
                     label="Download JSON",
                     data=json_data,
-                    file_name=f"reddit_marketing_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    file_name=f"reddit_marketing_results_{export_stamp}.json",
                     mime="application/json"
                 )
                 
@@ -361,10 +402,69 @@ def display_results(results: Dict[str, Any]):
                 st.download_button(
                     label="Download Report",
                     data=report,
-                    file_name=f"reddit_marketing_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                    file_name=f"reddit_marketing_report_{export_stamp}.txt",
                     mime="text/plain"
                 )
 
+@st.fragment
+def qa_table(qa_pairs: List[Dict[str, Any]]):
+    """Editable QA table; edits and favorites rerun only this fragment"""
+    saved = {fav['index'] for fav in st.session_state.get('favorites', [])}
+    rows = [
+        {
+            'title': qa_pair.get('title', 'No title'),
+            'subreddit': f"r/{qa_pair.get('subreddit', 'unknown')}",
+            'score': qa_pair.get('score', 0),
+            'num_comments': qa_pair.get('num_comments', 0),
+            'created': qa_date(qa_pair, '_date_long'),
+            'question': qa_pair.get('selftext', 'No question text'),
+            'ai_response': qa_pair.get('ai_response', 'No response generated'),
+            'url': qa_pair.get('url', '#'),
+            'favorite': i in saved
+        }
+        for i, qa_pair in enumerate(qa_pairs, 1)
+    ]
+    
+    st.data_editor(
+        rows,
+        column_config={
+            'title': st.column_config.TextColumn("❓ Question", width="medium"),
+            'subreddit': st.column_config.TextColumn("Subreddit"),
+            'score': st.column_config.NumberColumn("Score"),
+            'num_comments': st.column_config.NumberColumn("Comments"),
+            'created': st.column_config.TextColumn("Created"),
+            'question': st.column_config.TextColumn("Question Text", width="large"),
+            'ai_response': st.column_config.TextColumn("🤖 AI-Generated Response", width="large"),
+            'url': st.column_config.LinkColumn("URL", display_text="View on Reddit"),
+            'favorite': st.column_config.CheckboxColumn("⭐ Favorite")
+        },
+        disabled=['title', 'subreddit', 'score', 'num_comments', 'created', 'question', 'url'],
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        key="qa_editor",
+        on_change=apply_qa_edits,
+        args=(qa_pairs,)
+    )
+    st.caption("✏️ Edit responses directly in the table and tick ⭐ to save a favorite.")
+
+def _qa_stats(qa_pairs: List[Dict[str, Any]]) -> Tuple[int, float, int, Counter]:
+    """Return (count, average score, total comments, per-subreddit question counts)"""
+    avg_score = fmean([qa.get('score', 0) for qa in qa_pairs]) if qa_pairs else 0
+    total_comments = sum([qa.get('num_comments', 0) for qa in qa_pairs])
+    subreddit_counts = Counter([qa.get('subreddit', '') for qa in qa_pairs])
+    return len(qa_pairs), avg_score, total_comments, subreddit_counts
+
+def apply_qa_edits(qa_pairs: List[Dict]):
+    """Copy edits made in the results table back onto the QA pairs"""
+    saved = {fav['index'] for fav in st.session_state.get('favorites', [])}
+    for row, changes in st.session_state.qa_editor['edited_rows'].items():
+        qa_pair = qa_pairs[row]
+        if 'ai_response' in changes:
+            qa_pair['ai_response'] = changes['ai_response']
+        if changes.get('favorite') and row + 1 not in saved:
+            save_favorite_response(qa_pair, row + 1)
+
 def save_favorite_response(qa_pair: Dict, index: int):
     """Save a favorite response to session state"""
     if 'favorites' not in st.session_state:
@@ -381,79 +481,106 @@ def save_favorite_response(qa_pair: Dict, index: int):
     st.session_state.favorites.append(favorite)
     st.success(f"Response {index} saved to favorites!")
 
+def qa_date(qa: Dict[str, Any], key: str) -> str:
+    """A QA's preformatted date, formatted from created_utc if the QA didn't get one"""
+    date = qa.get(key)
+    if date is None:
+        date = datetime.fromtimestamp(qa.get('created_utc', 0)).strftime(_DATE_FORMATS[key])
+    return date
+
+@st.cache_data(show_spinner=False)
 def create_csv_export(results: Dict[str, Any]) -> str:
     """Create CSV export of the results"""
     qa_pairs = results.get('question_answer_pairs', [])
     
-    data = []
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=[
+        'title', 'subreddit', 'score', 'num_comments', 'created_date',
+        'question_text', 'ai_response', 'url'
+    ], lineterminator='\n')
+    writer.writeheader()
+    
     for qa in qa_pairs:
-        data.append({
+        writer.writerow({
             'title': qa.get('title', ''),
             'subreddit': qa.get('subreddit', ''),
             'score': qa.get('score', 0),
             'num_comments': qa.get('num_comments', 0),
-            'created_date': datetime.fromtimestamp(qa.get('created_utc', 0)).strftime('%Y-%m-%d'),
+            'created_date': qa_date(qa, '_date_short'),
             'question_text': qa.get('selftext', ''),
             'ai_response': qa.get('ai_response', ''),
             'url': qa.get('url', '')
         })
     
-    df = pd.DataFrame(data)
-    return df.to_csv(index=False)
+    return output.getvalue()
+
+@st.cache_data(show_spinner=False)
+def create_json_export(results: Dict[str, Any]) -> bytes:
+    """Create JSON export of the results"""
+    if 'question_answer_pairs' in results:
+        # Leave out the display-only date strings so the export keeps the workflow's schema
+        results = dict(results, question_answer_pairs=[
+            {key: value for key, value in qa.items() if key not in _DATE_FORMATS}
+            for qa in results['question_answer_pairs']
+        ])
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(results, indent=2, default=str).encode('utf-8')
 
 def generate_summary_report(results: Dict[str, Any]) -> str:
     """Generate a summary report of the results"""
-    report = f"""
+    parts = [f"""
 REDDIT MARKETING BOT - ANALYSIS REPORT
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ========================================
 BUSINESS ANALYSIS SUMMARY
 ========================================
-"""
+"""]
     
     if 'business_analysis' in results:
         business = results['business_analysis']
-        report += f"""
+        parts.append(f"""
 Product/Service: {business.get('product_summary', 'N/A')}
 Target Audience: {business.get('target_audience', 'N/A')}
 
 Key Benefits:
-"""
+""")
         for benefit in business.get('key_benefits', []):
-            report += f"• {benefit}\n"
+            parts.append(f"• {benefit}\n")
         
-        report += f"""
+        parts.append("""
 Recommended Subreddits:
-"""
+""")
         for subreddit in business.get('recommended_subreddits', []):
-            report += f"• r/{subreddit}\n"
+            parts.append(f"• r/{subreddit}\n")
     
     if 'question_answer_pairs' in results:
         qa_pairs = results['question_answer_pairs']
-        report += f"""
+        total_questions, avg_score, total_comments, subreddit_counts = _qa_stats(qa_pairs)
+        parts.append(f"""
 
 ========================================
 QUESTIONS & RESPONSES SUMMARY
 ========================================
-Total Questions Found: {len(qa_pairs)}
-Average Question Score: {sum(q.get('score', 0) for q in qa_pairs) / len(qa_pairs) if qa_pairs else 0:.1f}
-Total Comments: {sum(q.get('num_comments', 0) for q in qa_pairs)}
-Unique Subreddits: {len(set(q.get('subreddit', '') for q in qa_pairs))}
+Total Questions Found: {total_questions}
+Average Question Score: {avg_score:.1f}
+Total Comments: {total_comments}
+Unique Subreddits: {len(subreddit_counts)}
 
 ========================================
 DETAILED QUESTIONS & RESPONSES
 ========================================
-"""
+""")
         
         for i, qa in enumerate(qa_pairs, 1):
-            report += f"""
+            parts.append(f"""
 Question {i}:
 Title: {qa.get('title', 'No title')}
 Subreddit: r/{qa.get('subreddit', 'unknown')}
 Score: {qa.get('score', 0)} upvotes
 Comments: {qa.get('num_comments', 0)}
-Date: {datetime.fromtimestamp(qa.get('created_utc', 0)).strftime('%Y-%m-%d %H:%M')}
+Date: {qa_date(qa, '_date_long')}
 
 Question Text:
 {qa.get('selftext', 'No question text')}
@@ -464,9 +591,9 @@ AI-Generated Response:
 URL: {qa.get('url', '#')}
 
 ---
-"""
+""")
     
-    return report
+    return "".join(parts)
 
 if __name__ == "__main__":
     main()
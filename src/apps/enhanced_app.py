@@ -7,15 +7,31 @@ import os
 import sys
 import asyncio
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from dateutil import tz
 import json
 import io
-import PyPDF2
 from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
 import time
-import plotly.express as px
+import functools
+import threading
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import plotly.io as pio
+
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"  # Serialize figures with orjson
+except ImportError:  # Faster figure serialization is optional
+    pass
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # Arrow CSV writer is optional; pandas is the fallback
+    pa = None
 
 # Add the current directory to Python path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,6 +48,26 @@ except ImportError as e:
     st.error("Please ensure all required modules are in the same directory.")
     st.stop()
 
+@dataclass(slots=True)
+class AnalysisRecord:
+    """One completed analysis in the session history"""
+    timestamp: datetime
+    business_description: str
+    questions_found: int
+    style: str
+
+@dataclass(slots=True)
+class FavoriteQA:
+    """A question-answer pair saved to favorites"""
+    index: int
+    title: str
+    subreddit: str
+    response: str
+    url: str
+    saved_at: str
+    score: int
+    relevance_score: float
+
 # Page configuration
 st.set_page_config(
     page_title="Reddit Marketing AI Bot",
@@ -40,107 +76,41 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enhanced CSS for better UI
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3.5rem;
-        font-weight: bold;
-        background: linear-gradient(90deg, #FF4B4B, #FF6B6B);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        color: #FF6B6B;
-        margin-bottom: 1.5rem;
-        border-bottom: 2px solid #FF6B6B;
-        padding-bottom: 0.5rem;
-    }
-    .info-card {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border-left: 5px solid #FF4B4B;
-    }
-    .success-card {
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        color: #155724;
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-left: 5px solid #28a745;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    .warning-card {
-        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-        color: #856404;
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-left: 5px solid #ffc107;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    .question-card {
-        background: #ffffff;
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #FF4B4B;
-        margin: 1.5rem 0;
-        box-shadow: 0 8px 16px rgba(0,0,0,0.1);
-        transition: transform 0.2s;
-    }
-    .question-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 12px 20px rgba(0,0,0,0.15);
-    }
-    .answer-card {
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #28a745;
-        margin: 1.5rem 0;
-        box-shadow: 0 8px 16px rgba(0,0,0,0.1);
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        margin: 0.5rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    .progress-container {
-        background: #f1f3f4;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
-    }
-    .stButton > button {
-        background: linear-gradient(90deg, #FF4B4B, #FF6B6B);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 0.75rem 2rem;
-        font-weight: bold;
-        transition: all 0.3s;
-    }
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 16px rgba(255, 75, 75, 0.3);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Enhanced CSS for better UI, loaded once per process from style.css
+@st.cache_resource(show_spinner=False)
+def load_css():
+    """Read the app stylesheet"""
+    with open(os.path.join(current_dir, "style.css"), encoding="utf-8") as css_file:
+        return f"<style>\n{css_file.read()}</style>"
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Start a long-lived event loop on a daemon thread, shared across reruns"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="enhanced-app-loop").start()
+    return loop
+
+@st.cache_resource(show_spinner=False)
+def get_workflow_manager(gemini_api_key, reddit_client_id, reddit_client_secret):
+    """Build one WorkflowManager per set of credentials and share it across reruns"""
+    return WorkflowManager(
+        gemini_api_key=gemini_api_key,
+        reddit_client_id=reddit_client_id,
+        reddit_client_secret=reddit_client_secret
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_response_generator(gemini_api_key):
+    """Build one AIResponseGenerator per API key and share it across reruns"""
+    return AIResponseGenerator(gemini_api_key)
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
 
 def main():
+    st.markdown(load_css(), unsafe_allow_html=True)
+    
     # Header
     st.markdown('<h1 class="main-header">🤖 Reddit Marketing AI Bot</h1>', unsafe_allow_html=True)
     st.markdown(
@@ -166,10 +136,15 @@ def initialize_session_state():
     """Initialize all session state variables"""
     defaults = {
         'workflow_results': None,
+        'qa_df': None,
+        'results_version': 0,
+        'history_version': 0,
+        'derived_cache': {},
         'business_info': None,
         'processing': False,
         'api_configured': False,
         'favorites': [],
+        'favorite_titles': set(),
         'analysis_history': [],
         'current_tab': 'input'
     }
@@ -215,6 +190,10 @@ def configure_sidebar():
             st.session_state.include_nsfw = st.checkbox("Include NSFW subreddits", value=False)
             st.session_state.min_upvotes = st.number_input("Min upvotes", min_value=0, value=5)
             st.session_state.days_back = st.slider("Days back to search", 1, 30, 7)
+            st.session_state.max_concurrency = st.slider(
+                "Parallel AI requests", 1, 8, 3,
+                help="How many responses are generated at the same time"
+            )
             st.session_state.enable_caching = st.checkbox("Enable caching", value=True)
         
         # Help and Information
@@ -334,18 +313,24 @@ def get_example_description():
 
 Target customers: Small retail businesses (5-50 employees) struggling with manual inventory processes, overstocking, or stockouts. Perfect for boutiques, electronics stores, sporting goods retailers, and similar businesses looking to optimize their inventory management and reduce costs."""
 
+@st.cache_data(show_spinner=False)
+def parse_pdf_bytes(pdf_bytes):
+    """Extract the text of every page of a PDF, cached on the file contents"""
+    import fitz  # Deferred: only needed when a PDF is uploaded
+    
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_doc:
+        return "".join([page.get_text() for page in pdf_doc])
+
 def extract_pdf_text(uploaded_file):
     """Extract text from uploaded PDF"""
     try:
-        pdf_reader = PyPDF2.PdfReader(uploaded_file)
-        pdf_text = ""
-        for page in pdf_reader.pages:
-            pdf_text += page.extract_text()
+        pdf_text = parse_pdf_bytes(uploaded_file.getvalue())
         
         if pdf_text:
             st.success(f"✅ PDF processed! Extracted {len(pdf_text)} characters.")
             with st.expander("📄 View extracted text"):
-                st.text_area("Content:", value=pdf_text[:2000] + "..." if len(pdf_text) > 2000 else pdf_text, height=200, disabled=True)
+                preview = f"{pdf_text[:2000]}..." if len(pdf_text) > 2000 else pdf_text
+                st.text_area("Content:", value=preview, height=200, max_chars=2100, disabled=True)
             return pdf_text
         else:
             st.error("❌ Could not extract text from PDF")
@@ -384,10 +369,10 @@ def run_workflow_analysis(business_description):
     
     try:
         # Initialize workflow manager
-        workflow_manager = WorkflowManager(
-            gemini_api_key=st.session_state.gemini_api_key,
-            reddit_client_id=st.session_state.reddit_client_id,
-            reddit_client_secret=st.session_state.reddit_client_secret
+        workflow_manager = get_workflow_manager(
+            st.session_state.gemini_api_key,
+            st.session_state.reddit_client_id,
+            st.session_state.reddit_client_secret
         )
         
         # Update progress
@@ -395,14 +380,15 @@ def run_workflow_analysis(business_description):
         status_text.text("🔄 Initializing AI workflow...")
         
         # Run workflow
-        results = asyncio.run(workflow_manager.run_complete_workflow(
+        results = run_async(workflow_manager.run_complete_workflow(
             business_description=business_description,
             max_questions=st.session_state.max_questions,
             subreddit_limit=st.session_state.subreddit_limit,
             response_style=st.session_state.response_style,
             include_nsfw=st.session_state.include_nsfw,
             min_upvotes=st.session_state.min_upvotes,
-            days_back=st.session_state.days_back
+            days_back=st.session_state.days_back,
+            max_concurrency=st.session_state.max_concurrency
         ))
         
         progress_bar.progress(1.0)
@@ -410,16 +396,19 @@ def run_workflow_analysis(business_description):
         
         # Store results
         st.session_state.workflow_results = results
+        st.session_state.results_version += 1
+        store_question_data(results)
         st.session_state.business_info = results.get('business_analysis', {})
         
         # Add to history
-        analysis_record = {
-            'timestamp': datetime.now(),
-            'business_description': business_description[:100] + "...",
-            'questions_found': len(results.get('question_answer_pairs', [])),
-            'style': st.session_state.response_style
-        }
+        analysis_record = AnalysisRecord(
+            timestamp=datetime.now(),
+            business_description=business_description[:100] + "...",
+            questions_found=len(results.get('question_answer_pairs', [])),
+            style=st.session_state.response_style
+        )
         st.session_state.analysis_history.append(analysis_record)
+        st.session_state.history_version += 1
         
         st.success("🎉 Analysis completed successfully!")
         time.sleep(1)
@@ -455,30 +444,32 @@ def show_results_summary(results):
     st.markdown('<h2 class="sub-header">📊 Analysis Summary</h2>', unsafe_allow_html=True)
     
     summary = results.get('workflow_summary', {})
-    qa_pairs = results.get('question_answer_pairs', [])
+    qa_df = get_qa_frame(results)
+    avg_score, total_comments, unique_subreddits = memoize_by_version('summary_metrics', lambda: (
+        qa_df['score'].mean() if len(qa_df) else 0,
+        int(qa_df['num_comments'].sum()),
+        qa_df['subreddit'].nunique()
+    ))
     
     # Metrics cards
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Questions Found", len(qa_pairs))
+        st.metric("Questions Found", len(qa_df))
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        avg_score = sum(q.get('score', 0) for q in qa_pairs) / len(qa_pairs) if qa_pairs else 0
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         st.metric("Avg Question Score", f"{avg_score:.1f}")
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col3:
-        total_comments = sum(q.get('num_comments', 0) for q in qa_pairs)
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         st.metric("Total Comments", total_comments)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col4:
-        unique_subreddits = len(set(q.get('subreddit', '') for q in qa_pairs))
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         st.metric("Subreddits", unique_subreddits)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -521,6 +512,7 @@ def show_business_analysis_summary(results):
             for subreddit in subreddits[:5]:
                 st.write(f"• r/{subreddit}")
 
+@st.fragment
 def show_questions_and_answers(results):
     """Show questions and AI-generated answers"""
     qa_pairs = results.get('question_answer_pairs', [])
@@ -531,67 +523,162 @@ def show_questions_and_answers(results):
     
     st.markdown('<h3 class="sub-header">💬 Questions & AI Responses</h3>', unsafe_allow_html=True)
     
+    qa_df = get_qa_frame(results)
+    
     # Filters
     col1, col2, col3 = st.columns(3)
     with col1:
         sort_by = st.selectbox("Sort by:", ["Relevance", "Upvotes", "Comments", "Date"])
     with col2:
-        filter_subreddit = st.selectbox("Filter by subreddit:", ["All"] + list(set(q.get('subreddit', '') for q in qa_pairs)))
+        filter_subreddit = st.selectbox("Filter by subreddit:", ["All"] + st.session_state.subreddits_sorted)
     with col3:
-        min_score_filter = st.slider("Min score:", 0, max(q.get('score', 0) for q in qa_pairs), 0)
+        min_score_filter = st.slider("Min score:", 0, st.session_state.max_score, 0)
     
     # Apply filters and sorting
-    filtered_qa = filter_and_sort_questions(qa_pairs, sort_by, filter_subreddit, min_score_filter)
+    filtered_qa = filter_and_sort_questions(qa_pairs, qa_df, sort_by, filter_subreddit, min_score_filter)
+    
+    # Question list as a single virtualized table
+    question_table = pd.DataFrame({
+        'title': [q.get('title', 'No title') for q in filtered_qa],
+        'subreddit': [f"r/{q.get('subreddit', 'unknown')}" for q in filtered_qa],
+        'score': [q.get('score', 0) for q in filtered_qa],
+        'num_comments': [q.get('num_comments', 0) for q in filtered_qa],
+        'relevance_score': [q.get('relevance_score', 0) for q in filtered_qa],
+        'created_str': [q['created_str'] for q in filtered_qa],
+        'url': [q.get('url', '') for q in filtered_qa]
+    })
+    event = st.dataframe(
+        question_table,
+        column_config={
+            'title': st.column_config.TextColumn("❓ Question", width="large"),
+            'subreddit': st.column_config.TextColumn("📍 Subreddit"),
+            'score': st.column_config.NumberColumn("Upvotes"),
+            'num_comments': st.column_config.NumberColumn("Comments"),
+            'relevance_score': st.column_config.ProgressColumn(
+                "Relevance", min_value=0, max_value=max(1.0, float(qa_df['relevance_score'].max())), format="%.2f"
+            ),
+            'created_str': st.column_config.TextColumn("📅 Posted"),
+            'url': st.column_config.LinkColumn("🔗 URL", display_text="View on Reddit")
+        },
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="qa_table"
+    )
+    
+    # Detail card and actions for the selected question only
+    selected_rows = [row for row in event.selection.rows if row < len(filtered_qa)]
+    if selected_rows:
+        row = selected_rows[0]
+        display_question_answer_pair(filtered_qa[row], row + 1)
+    else:
+        st.info("👆 Select a question in the table to view its AI response and actions.")
+
+def build_qa_frame(qa_pairs):
+    """Build a typed DataFrame of the filterable/sortable question fields.
+    
+    Also stamps each question with a preformatted 'created_str' date.
+    """
+    qa_df = pd.DataFrame(qa_pairs, columns=['subreddit', 'score', 'num_comments', 'relevance_score', 'created_utc'])
+    qa_df = qa_df.fillna({'subreddit': '', 'score': 0, 'num_comments': 0, 'relevance_score': 0, 'created_utc': 0})
+    qa_df = qa_df.astype({
+        'subreddit': 'category',
+        'score': 'int32',
+        'num_comments': 'int32',
+        'relevance_score': 'float32',
+        'created_utc': 'float64'
+    })
+    
+    # Format all dates in one pass, in local time like datetime.fromtimestamp; tzlocal looks up
+    # the offset per timestamp, so posts from across a DST change keep the right hour
+    created_strs = (
+        pd.to_datetime(qa_df['created_utc'], unit='s', utc=True)
+        .dt.tz_convert(tz.tzlocal())
+        .dt.strftime('%Y-%m-%d %H:%M')
+    )
+    for qa_pair, created_str in zip(qa_pairs, created_strs):
+        qa_pair['created_str'] = created_str
     
-    # Display questions and answers
-    for i, qa_pair in enumerate(filtered_qa, 1):
-        display_question_answer_pair(qa_pair, i)
+    return qa_df
+
+def memoize_by_version(name, build, version_key='results_version'):
+    """Return session-cached derived data, rebuilding only when the version counter changes"""
+    cache = st.session_state.setdefault('derived_cache', {})
+    version = st.session_state.get(version_key, 0)
+    entry = cache.get(name)
+    if entry is None or entry[0] != version:
+        entry = (version, build())
+        cache[name] = entry
+    return entry[1]
 
-def filter_and_sort_questions(qa_pairs, sort_by, filter_subreddit, min_score):
+def store_question_data(results):
+    """Cache the question DataFrame and filter-widget aggregates for new results"""
+    qa_df = build_qa_frame(results.get('question_answer_pairs', []))
+    st.session_state.qa_df = qa_df
+    st.session_state.subreddits_sorted = sorted(qa_df['subreddit'].cat.categories)
+    st.session_state.max_score = int(qa_df['score'].max()) if len(qa_df) else 0
+
+def get_qa_frame(results):
+    """Return the cached question DataFrame, building it if missing"""
+    if st.session_state.get('qa_df') is None:
+        store_question_data(results)
+    return st.session_state.qa_df
+
+def filter_and_sort_questions(qa_pairs, qa_df, sort_by, filter_subreddit, min_score):
     """Filter and sort questions based on user selections"""
     # Filter
-    filtered = qa_pairs
+    mask = qa_df['score'] >= min_score
     
     if filter_subreddit != "All":
-        filtered = [q for q in filtered if q.get('subreddit') == filter_subreddit]
-    
-    filtered = [q for q in filtered if q.get('score', 0) >= min_score]
+        mask &= qa_df['subreddit'] == filter_subreddit
     
     # Sort
-    if sort_by == "Relevance":
-        filtered.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-    elif sort_by == "Upvotes":
-        filtered.sort(key=lambda x: x.get('score', 0), reverse=True)
-    elif sort_by == "Comments":
-        filtered.sort(key=lambda x: x.get('num_comments', 0), reverse=True)
-    elif sort_by == "Date":
-        filtered.sort(key=lambda x: x.get('created_utc', 0), reverse=True)
-    
-    return filtered
+    sort_column = {
+        "Relevance": 'relevance_score',
+        "Upvotes": 'score',
+        "Comments": 'num_comments',
+        "Date": 'created_utc'
+    }[sort_by]
+    keys = qa_df[sort_column].to_numpy(dtype=np.float64)
+    rows = np.flatnonzero(mask.to_numpy())
+    order = rows[np.argsort(-keys[rows], kind='stable')]
+    
+    return [qa_pairs[i] for i in order]
 
-def display_question_answer_pair(qa_pair, index):
-    """Display a single question-answer pair"""
-    with st.container():
-        # Question card
-        st.markdown(f"""
+def render_card_html(qa_pair, index):
+    """Build the read-only question and AI response card HTML"""
+    title = qa_pair.get('title', 'No title')
+    subreddit = qa_pair.get('subreddit', 'unknown')
+    score = qa_pair.get('score', 0)
+    num_comments = qa_pair.get('num_comments', 0)
+    relevance_score = qa_pair.get('relevance_score', 0)
+    selftext = qa_pair.get('selftext', 'No question text')
+    question_text = f"{selftext[:500]}..." if len(selftext) > 500 else selftext
+    url = qa_pair.get('url', '#')
+    ai_response = qa_pair.get('ai_response', 'No response generated')
+    
+    return f"""
         <div class="question-card">
-            <h4>❓ Question {index}: {qa_pair.get('title', 'No title')}</h4>
-            <p><strong>📍 Subreddit:</strong> r/{qa_pair.get('subreddit', 'unknown')}</p>
-            <p><strong>📊 Metrics:</strong> {qa_pair.get('score', 0)} upvotes • {qa_pair.get('num_comments', 0)} comments • Relevance: {qa_pair.get('relevance_score', 0):.2f}</p>
-            <p><strong>📅 Posted:</strong> {datetime.fromtimestamp(qa_pair.get('created_utc', 0)).strftime('%Y-%m-%d %H:%M')}</p>
+            <h4>❓ Question {index}: {title}</h4>
+            <p><strong>📍 Subreddit:</strong> r/{subreddit}</p>
+            <p><strong>📊 Metrics:</strong> {score} upvotes • {num_comments} comments • Relevance: {relevance_score:.2f}</p>
+            <p><strong>📅 Posted:</strong> {qa_pair['created_str']}</p>
             <p><strong>❓ Question:</strong></p>
-            <p>{qa_pair.get('selftext', 'No question text')[:500]}{'...' if len(qa_pair.get('selftext', '')) > 500 else ''}</p>
-            <p><strong>🔗 URL:</strong> <a href="{qa_pair.get('url', '#')}" target="_blank">View on Reddit</a></p>
+            <p>{question_text}</p>
+            <p><strong>🔗 URL:</strong> <a href="{url}" target="_blank">View on Reddit</a></p>
         </div>
-        """, unsafe_allow_html=True)
-        
-        # AI Response card
-        st.markdown(f"""
         <div class="answer-card">
             <h4>🤖 AI-Generated Response</h4>
-            <p>{qa_pair.get('ai_response', 'No response generated')}</p>
+            <p>{ai_response}</p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+def display_question_answer_pair(qa_pair, index):
+    """Display a single question-answer pair"""
+    with st.container():
+        # Question and AI response cards in a single markdown message
+        st.markdown(render_card_html(qa_pair, index), unsafe_allow_html=True)
         
         # Quality metrics
         quality_metrics = qa_pair.get('quality_metrics', {})
@@ -653,24 +740,29 @@ def display_question_answer_pair(qa_pair, index):
 
 def add_to_favorites(qa_pair, index):
     """Add a question-answer pair to favorites"""
-    favorite = {
-        'index': index,
-        'title': qa_pair.get('title', ''),
-        'subreddit': qa_pair.get('subreddit', ''),
-        'response': qa_pair.get('ai_response', ''),
-        'url': qa_pair.get('url', ''),
-        'saved_at': datetime.now().isoformat(),
-        'score': qa_pair.get('score', 0),
-        'relevance_score': qa_pair.get('relevance_score', 0)
-    }
+    favorite = FavoriteQA(
+        index=index,
+        title=qa_pair.get('title', ''),
+        subreddit=qa_pair.get('subreddit', ''),
+        response=qa_pair.get('ai_response', ''),
+        url=qa_pair.get('url', ''),
+        saved_at=datetime.now().isoformat(),
+        score=qa_pair.get('score', 0),
+        relevance_score=qa_pair.get('relevance_score', 0)
+    )
     
     if 'favorites' not in st.session_state:
         st.session_state.favorites = []
+    if 'favorite_titles' not in st.session_state:
+        st.session_state.favorite_titles = {fav.title for fav in st.session_state.favorites}
     
     # Check if already in favorites
-    if not any(fav['title'] == favorite['title'] for fav in st.session_state.favorites):
+    if favorite.title not in st.session_state.favorite_titles:
         st.session_state.favorites.append(favorite)
+        st.session_state.favorite_titles.add(favorite.title)
         st.success(f"✅ Added to favorites!")
+        # We're called from the Q&A fragment; rerun the whole app so the Favorites fragment redraws too
+        st.rerun(scope="app")
     else:
         st.warning("Already in favorites!")
 
@@ -682,8 +774,8 @@ def regenerate_response(qa_pair, index):
     
     try:
         with st.spinner("🔄 Regenerating response..."):
-            response_generator = AIResponseGenerator(st.session_state.gemini_api_key)
-            new_response = asyncio.run(response_generator.generate_response(
+            response_generator = get_response_generator(st.session_state.gemini_api_key)
+            new_response = run_async(response_generator.generate_response(
                 question_data=qa_pair,
                 business_info=st.session_state.business_info,
                 response_style=st.session_state.response_style
@@ -694,6 +786,7 @@ def regenerate_response(qa_pair, index):
     except Exception as e:
         st.error(f"❌ Failed to regenerate: {str(e)}")
 
+@st.fragment
 def show_favorites_interface():
     """Show favorites interface"""
     st.markdown('<h2 class="sub-header">⭐ Favorite Responses</h2>', unsafe_allow_html=True)
@@ -707,26 +800,28 @@ def show_favorites_interface():
     
     # Display favorites
     for i, favorite in enumerate(st.session_state.favorites):
-        with st.expander(f"⭐ {favorite['title'][:50]}..." if len(favorite['title']) > 50 else favorite['title'], expanded=False):
-            st.markdown(f"**Subreddit:** r/{favorite['subreddit']}")
-            st.markdown(f"**Score:** {favorite['score']} upvotes")
-            st.markdown(f"**Relevance:** {favorite.get('relevance_score', 0):.2f}")
-            st.markdown(f"**Saved:** {favorite['saved_at'][:16]}")
+        with st.expander(f"⭐ {favorite.title[:50]}..." if len(favorite.title) > 50 else favorite.title, expanded=False):
+            st.markdown(f"**Subreddit:** r/{favorite.subreddit}")
+            st.markdown(f"**Score:** {favorite.score} upvotes")
+            st.markdown(f"**Relevance:** {favorite.relevance_score:.2f}")
+            st.markdown(f"**Saved:** {favorite.saved_at[:16]}")
             st.markdown("**Response:**")
-            st.markdown(favorite['response'])
+            st.markdown(favorite.response)
             
             col1, col2, col3 = st.columns(3)
             with col1:
                 if st.button(f"📋 Copy", key=f"fav_copy_{i}"):
-                    st.code(favorite['response'])
+                    st.code(favorite.response)
             with col2:
                 if st.button(f"🔗 View Original", key=f"fav_view_{i}"):
-                    st.markdown(f"[Open in Reddit]({favorite.get('url', '#')})")
+                    st.markdown(f"[Open in Reddit]({favorite.url or '#'})")
             with col3:
                 if st.button(f"🗑️ Remove", key=f"fav_remove_{i}"):
-                    st.session_state.favorites.pop(i)
+                    removed = st.session_state.favorites.pop(i)
+                    st.session_state.favorite_titles.discard(removed.title)
                     st.rerun()
 
+@st.fragment
 def show_analytics_interface():
     """Show analytics and insights interface"""
     st.markdown('<h2 class="sub-header">📈 Analytics & Insights</h2>', unsafe_allow_html=True)
@@ -742,99 +837,115 @@ def show_analytics_interface():
         st.warning("No data available for analytics.")
         return
     
-    # Analytics tabs
-    analytics_tab1, analytics_tab2, analytics_tab3 = st.tabs(["📊 Question Analysis", "🎯 Subreddit Performance", "⏱️ Analysis History"])
+    # Analytics views; unlike st.tabs, only the selected view is built and sent to the browser
+    analytics_view = st.radio(
+        "Analytics view",
+        ["📊 Question Analysis", "🎯 Subreddit Performance", "⏱️ Analysis History"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="analytics_view"
+    )
     
-    with analytics_tab1:
+    if analytics_view == "📊 Question Analysis":
         show_question_analytics(qa_pairs)
-    
-    with analytics_tab2:
+    elif analytics_view == "🎯 Subreddit Performance":
         show_subreddit_analytics(qa_pairs)
-    
-    with analytics_tab3:
+    else:
         show_analysis_history()
 
 def show_question_analytics(qa_pairs):
     """Show question analytics charts"""
-    # Score distribution
-    scores = [q.get('score', 0) for q in qa_pairs]
-    relevance_scores = [q.get('relevance_score', 0) for q in qa_pairs]
+    points = memoize_by_version('question_points', lambda: tuple(
+        (q.get('id', ''), q.get('score', 0), q.get('relevance_score', 0)) for q in qa_pairs
+    ))
+    fig_scores, fig_relevance, fig_scatter = build_question_figures(points)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_scores = px.histogram(
-            x=scores,
-            nbins=20,
-            title="Question Score Distribution",
-            labels={'x': 'Upvotes', 'y': 'Count'}
-        )
-        st.plotly_chart(fig_scores, use_container_width=True)
+        st.plotly_chart(fig_scores, use_container_width=True, config={'staticPlot': True})
     
     with col2:
-        fig_relevance = px.histogram(
-            x=relevance_scores,
-            nbins=20,
-            title="Relevance Score Distribution",
-            labels={'x': 'Relevance Score', 'y': 'Count'}
-        )
-        st.plotly_chart(fig_relevance, use_container_width=True)
+        st.plotly_chart(fig_relevance, use_container_width=True, config={'staticPlot': True})
     
     # Scatter plot of score vs relevance
-    fig_scatter = px.scatter(
-        x=scores,
-        y=relevance_scores,
-        title="Question Score vs Relevance",
-        labels={'x': 'Upvotes', 'y': 'Relevance Score'},
-        hover_data=['x', 'y']
-    )
     st.plotly_chart(fig_scatter, use_container_width=True)
 
-def show_subreddit_analytics(qa_pairs):
-    """Show subreddit performance analytics"""
-    # Subreddit distribution
-    subreddit_counts = {}
-    subreddit_avg_scores = {}
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_question_figures(points):
+    """Build question analytics figures from (id, score, relevance_score) tuples"""
+    # Score distribution
+    scores = [score for _, score, _ in points]
+    relevance_scores = [relevance for _, _, relevance in points]
     
-    for qa in qa_pairs:
-        subreddit = qa.get('subreddit', 'unknown')
-        score = qa.get('score', 0)
-        
-        if subreddit not in subreddit_counts:
-            subreddit_counts[subreddit] = 0
-            subreddit_avg_scores[subreddit] = []
-        
-        subreddit_counts[subreddit] += 1
-        subreddit_avg_scores[subreddit].append(score)
+    fig_scores = go.Figure(go.Histogram(x=scores, nbinsx=20))
+    fig_scores.update_layout(title="Question Score Distribution", xaxis_title="Upvotes", yaxis_title="Count")
     
-    # Calculate averages
-    for subreddit in subreddit_avg_scores:
-        scores = subreddit_avg_scores[subreddit]
-        subreddit_avg_scores[subreddit] = sum(scores) / len(scores) if scores else 0
+    fig_relevance = go.Figure(go.Histogram(x=relevance_scores, nbinsx=20))
+    fig_relevance.update_layout(title="Relevance Score Distribution", xaxis_title="Relevance Score", yaxis_title="Count")
     
-    col1, col2 = st.columns(2)
+    # WebGL scatter keeps rendering fast as points accumulate
+    fig_scatter = go.Figure(go.Scattergl(
+        x=scores,
+        y=relevance_scores,
+        mode='markers',
+        hovertemplate="%{x} upvotes<br>%{y:.2f} relevance<extra></extra>"
+    ))
+    fig_scatter.update_layout(title="Question Score vs Relevance", xaxis_title="Upvotes", yaxis_title="Relevance Score")
     
-    with col1:
-        # Questions per subreddit
-        fig_counts = px.bar(
-            x=list(subreddit_counts.keys()),
-            y=list(subreddit_counts.values()),
-            title="Questions Found per Subreddit",
-            labels={'x': 'Subreddit', 'y': 'Number of Questions'}
-        )
-        fig_counts.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_counts, use_container_width=True)
+    return fig_scores, fig_relevance, fig_scatter
+
+def show_subreddit_analytics(qa_pairs):
+    """Show subreddit performance analytics"""
+    fig = memoize_by_version('subreddit_figure', lambda: build_subreddit_figure(
+        tuple((q.get('subreddit', 'unknown'), q.get('score', 0)) for q in qa_pairs)
+    ))
     
-    with col2:
-        # Average scores per subreddit
-        fig_avg_scores = px.bar(
-            x=list(subreddit_avg_scores.keys()),
-            y=list(subreddit_avg_scores.values()),
-            title="Average Question Score per Subreddit",
-            labels={'x': 'Subreddit', 'y': 'Average Score'}
-        )
-        fig_avg_scores.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_avg_scores, use_container_width=True)
+    # Questions per subreddit and average scores side by side
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_subreddit_figure(points):
+    """Build the subreddit analytics figure from (subreddit, score) tuples"""
+    # Subreddit distribution and average score in one groupby pass
+    subreddit_df = pd.DataFrame(list(points), columns=['subreddit', 'score'])
+    subreddit_stats = subreddit_df.groupby('subreddit', sort=False, observed=True)['score'].agg(['size', 'mean'])
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Questions Found per Subreddit", "Average Question Score per Subreddit")
+    )
+    fig.add_trace(go.Bar(x=subreddit_stats.index, y=subreddit_stats['size'].values, name="Questions"), 1, 1)
+    fig.add_trace(go.Bar(x=subreddit_stats.index, y=subreddit_stats['mean'].values, name="Average Score"), 1, 2)
+    fig.update_xaxes(tickangle=45, title_text="Subreddit")
+    fig.update_yaxes(title_text="Number of Questions", row=1, col=1)
+    fig.update_yaxes(title_text="Average Score", row=1, col=2)
+    fig.update_layout(showlegend=False)
+    
+    return fig
+
+@functools.lru_cache(maxsize=1)
+def history_column_config():
+    """Column configuration for the analysis history table, built once per process"""
+    return {
+        "timestamp": st.column_config.DatetimeColumn("Date & Time"),
+        "business_description": st.column_config.TextColumn("Business Description"),
+        "questions_found": st.column_config.NumberColumn("Questions Found"),
+        "style": st.column_config.TextColumn("Response Style")
+    }
+
+def history_to_csv(history_df):
+    """Encode the history table as CSV bytes, using Arrow's writer when available"""
+    if pa is None:
+        return history_df.to_csv(index=False).encode('utf-8')
+    
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(
+        pa.Table.from_pandas(history_df, preserve_index=False),
+        buf,
+        write_options=pacsv.WriteOptions(quoting_style="needed")
+    )
+    return buf.getvalue().to_pybytes()
 
 def show_analysis_history():
     """Show analysis history"""
@@ -842,26 +953,22 @@ def show_analysis_history():
         st.info("No analysis history yet. Complete some analyses to see history here.")
         return
     
-    history_df = pd.DataFrame(st.session_state.analysis_history)
+    history_df = memoize_by_version(
+        'history_df', lambda: pd.DataFrame(st.session_state.analysis_history), version_key='history_version'
+    )
     
     # Display as table
     st.dataframe(
         history_df,
-        column_config={
-            "timestamp": st.column_config.DatetimeColumn("Date & Time"),
-            "business_description": st.column_config.TextColumn("Business Description"),
-            "questions_found": st.column_config.NumberColumn("Questions Found"),
-            "style": st.column_config.TextColumn("Response Style")
-        },
+        column_config=history_column_config(),
         use_container_width=True
     )
     
     # Export history
     if st.button("📤 Export History"):
-        csv = history_df.to_csv(index=False)
         st.download_button(
             "Download CSV",
-            data=csv,
+            data=history_to_csv(history_df),
             file_name=f"analysis_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
@@ -6,8 +6,18 @@ Streamlit application with complete workflow including posting capabilities
 import streamlit as st
 import asyncio
 import os
+import time
+import functools
+import threading
 from datetime import datetime
 import json
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Faster JSON export is optional
+    orjson = None
 
 # Set page config
 st.set_page_config(
@@ -19,8 +29,9 @@ st.set_page_config(
 
 # Import our components
 from workflow_manager import WorkflowManager
-from config import REDDIT_CONFIG
+from config import REDDIT_CONFIG, is_placeholder
 from reddit_poster import RedditPoster
+from reddit_analyzer import RedditAnalyzer
 
 # Initialize session state
 if 'workflow_results' not in st.session_state:
@@ -30,15 +41,65 @@ if 'posting_enabled' not in st.session_state:
 if 'reddit_credentials_valid' not in st.session_state:
     st.session_state.reddit_credentials_valid = False
 
+# Credential fields that must be filled in (not placeholders) to enable posting
+_REQUIRED = ('client_id', 'client_secret', 'username', 'password')
+
 def check_reddit_credentials():
     """Check if Reddit credentials are properly configured"""
     config = st.session_state.get('reddit_config', REDDIT_CONFIG)
-    
-    required_fields = ['client_id', 'client_secret', 'username', 'password']
-    for field in required_fields:
-        if not config.get(field) or config[field].startswith('YOUR_'):
-            return False
-    return True
+    return _credentials_valid(tuple(config.get(field) for field in _REQUIRED))
+
+@functools.lru_cache(maxsize=4)
+def _credentials_valid(values):
+    """Validate a tuple of credential values; unchanged configs hit the cache"""
+    return not any(is_placeholder(value) for value in values)
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Start a long-lived event loop on a daemon thread, shared across reruns"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="posting-app-loop").start()
+    return loop
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+@st.cache_resource(show_spinner=False)
+def get_workflow_manager(gemini_api_key, client_id, client_secret, username=None, password=None):
+    """Build one WorkflowManager per set of credentials and share it across reruns"""
+    return WorkflowManager(
+        gemini_api_key=gemini_api_key,
+        reddit_client_id=client_id,
+        reddit_client_secret=client_secret,
+        reddit_username=username,
+        reddit_password=password
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_poster(client_id, client_secret, username, password):
+    """Build one RedditPoster per set of credentials and share it across reruns"""
+    return RedditPoster(
+        client_id=client_id,
+        client_secret=client_secret,
+        username=username,
+        password=password
+    )
+
+@st.cache_data(show_spinner=False)
+def load_history_file(path, mtime_ns):
+    """Parse a posting history file; mtime_ns keys the cache so edits invalidate it"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def refresh_posting_history(poster, path="posting_history.json"):
+    """Give the poster the on-disk history, re-reading the file only when it changed"""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return
+    poster.set_posting_history(load_history_file(path, mtime_ns))
 
 def main():
     st.title("🤖 Reddit Marketing Bot Pro")
@@ -235,36 +296,42 @@ def main():
     if st.session_state.workflow_results:
         display_results(st.session_state.workflow_results)
 
-def run_workflow(business_description, gemini_api_key, reddit_config, **kwargs):
-    """Run the complete workflow"""
-    with st.spinner("🔄 Running Reddit Marketing Workflow..."):
+def run_workflow(business_description, gemini_api_key, reddit_config, poll_interval=0.25, **kwargs):
+    """Run the complete workflow on the background event loop while reporting progress"""
+    with st.status("🔄 Running Reddit Marketing Workflow...") as status:
         try:
             # Initialize workflow manager
-            workflow_manager = WorkflowManager(
-                gemini_api_key=gemini_api_key,
-                reddit_client_id=reddit_config['client_id'],
-                reddit_client_secret=reddit_config['client_secret'],
-                reddit_username=reddit_config['username'] if kwargs.get('auto_post') else None,
-                reddit_password=reddit_config['password'] if kwargs.get('auto_post') else None
+            workflow_manager = get_workflow_manager(
+                gemini_api_key,
+                reddit_config['client_id'],
+                reddit_config['client_secret'],
+                reddit_config['username'] if kwargs.get('auto_post') else None,
+                reddit_config['password'] if kwargs.get('auto_post') else None
             )
             
-            # Run workflow
-            results = asyncio.run(
+            # Run workflow without blocking status updates
+            future = asyncio.run_coroutine_threadsafe(
                 workflow_manager.run_complete_workflow(
                     business_description=business_description,
                     **kwargs
-                )
+                ),
+                get_event_loop()
             )
+            started = time.monotonic()
+            while not future.done():
+                status.update(label=f"🔄 Running Reddit Marketing Workflow... ({time.monotonic() - started:.0f}s)")
+                time.sleep(poll_interval)
+            results = future.result()
             
             st.session_state.workflow_results = results
             
             if results.get('workflow_summary', {}).get('success', False):
-                st.success("✅ Workflow completed successfully!")
+                status.update(label="✅ Workflow completed successfully!", state="complete")
             else:
-                st.error("❌ Workflow completed with errors")
+                status.update(label="❌ Workflow completed with errors", state="error")
                 
         except Exception as e:
-            st.error(f"❌ Workflow failed: {str(e)}")
+            status.update(label=f"❌ Workflow failed: {str(e)}", state="error")
 
 def show_posting_stats():
     """Show posting statistics"""
@@ -274,15 +341,8 @@ def show_posting_stats():
     
     try:
         config = st.session_state.reddit_config
-        poster = RedditPoster(
-            client_id=config['client_id'],
-            client_secret=config['client_secret'],
-            username=config['username'],
-            password=config['password']
-        )
-        
-        # Load posting history
-        poster.load_posting_history()
+        poster = get_poster(config['client_id'], config['client_secret'], config['username'], config['password'])
+        refresh_posting_history(poster)
         
         stats = poster.get_posting_stats()
         
@@ -322,19 +382,14 @@ def test_reddit_connection():
             config = st.session_state.reddit_config
             
             # Test basic connection
-            from reddit_analyzer import RedditAnalyzer
             analyzer = RedditAnalyzer(config['client_id'], config['client_secret'])
             
             # Test posting connection if credentials provided
             if config['username'] and config['password']:
-                poster = RedditPoster(
-                    client_id=config['client_id'],
-                    client_secret=config['client_secret'],
-                    username=config['username'],
-                    password=config['password']
-                )
+                poster = get_poster(config['client_id'], config['client_secret'], config['username'], config['password'])
+                refresh_posting_history(poster)
                 
-                success = asyncio.run(poster.initialize())
+                success = poster.authenticated or run_async(poster.initialize())
                 if success:
                     stats = poster.get_posting_stats()
                     st.success(f"✅ Reddit connection successful!")
@@ -351,8 +406,12 @@ def display_results(results):
     """Display workflow results"""
     st.header("📊 Workflow Results")
     
+    # Look up each section once per rerun
+    summary = results.get('workflow_summary') or {}
+    posting = results.get('posting_results') or {}
+    qa_pairs = results.get('question_answer_pairs') or []
+    
     # Summary metrics
-    summary = results.get('workflow_summary', {})
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -363,38 +422,28 @@ def display_results(results):
         st.metric("Responses Generated", summary.get('responses_generated', 0))
     
     with col3:
-        success_rate = "100%" if summary.get('success', False) else "Failed"
+        success_rate = "100%" if summary.get('success') else "Failed"
         st.metric("Success Rate", success_rate)
     
     with col4:
-        posting_results = results.get('posting_results', {})
-        if posting_results:
-            posted_count = posting_results.get('posted', 0)
-            st.metric("Comments Posted", posted_count)
+        if posting:
+            st.metric("Comments Posted", posting.get('posted', 0))
     
     # Posting Results (if available)
-    if results.get('posting_results'):
-        posting_results = results['posting_results']
-        
+    if posting:
         st.subheader("📝 Posting Results")
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Posted", posting_results.get('posted', 0))
+            st.metric("Posted", posting.get('posted', 0))
         with col2:
-            st.metric("Skipped", posting_results.get('skipped', 0))
+            st.metric("Skipped", posting.get('skipped', 0))
         with col3:
-            st.metric("Failed", posting_results.get('failed', 0))
+            st.metric("Failed", posting.get('failed', 0))
         
         # Show posting details
-        if posting_results.get('details'):
-            with st.expander("📋 Posting Details", expanded=True):
-                for detail in posting_results['details']:
-                    status_emoji = "✅" if detail['success'] else "❌"
-                    st.write(f"{status_emoji} **{detail['question_title']}** (r/{detail['subreddit']})")
-                    st.write(f"   {detail['message']}")
-                    if detail.get('comment_url'):
-                        st.write(f"   🔗 [View Comment]({detail['comment_url']})")
+        if posting.get('details'):
+            render_posting_details(posting)
     
     # Business Analysis
     business_analysis = results.get('business_analysis', {})
@@ -420,37 +469,11 @@ def display_results(results):
                 st.write(f"• {benefit}")
     
     # Questions and Responses
-    qa_pairs = results.get('question_answer_pairs', [])
     if qa_pairs:
         st.subheader("💬 Generated Responses")
         
         for i, qa in enumerate(qa_pairs, 1):
-            with st.expander(f"#{i} - r/{qa.get('subreddit', 'unknown')} - {qa.get('title', 'Untitled')[:60]}..."):
-                
-                col1, col2 = st.columns([1, 2])
-                
-                with col1:
-                    st.write("**Question Details:**")
-                    st.write(f"**Subreddit:** r/{qa.get('subreddit', 'unknown')}")
-                    st.write(f"**Score:** {qa.get('score', 0)} upvotes")
-                    st.write(f"**Comments:** {qa.get('num_comments', 0)}")
-                    
-                    if qa.get('relevance_score'):
-                        st.write(f"**Relevance:** {qa.get('relevance_score', 0):.2f}/1.0")
-                    
-                    if qa.get('url'):
-                        st.write(f"🔗 [View Original]({qa.get('url')})")
-                
-                with col2:
-                    st.write("**Original Question:**")
-                    st.write(qa.get('title', 'N/A'))
-                    
-                    if qa.get('selftext'):
-                        st.write("**Question Body:**")
-                        st.write(qa.get('selftext', '')[:200] + "..." if len(qa.get('selftext', '')) > 200 else qa.get('selftext', ''))
-                    
-                    st.write("**Generated Response:**")
-                    st.write(qa.get('ai_response', 'No response generated'))
+            render_qa(i, qa)
     
     # Errors (if any)
     errors = results.get('errors', [])
@@ -466,7 +489,7 @@ def display_results(results):
     
     with col1:
         if st.button("📁 Download JSON Results"):
-            results_json = json.dumps(results, indent=2, default=str)
+            results_json = create_json_export(results)
             st.download_button(
                 label="💾 Download Results.json",
                 data=results_json,
@@ -477,7 +500,7 @@ def display_results(results):
     with col2:
         if st.button("📝 Download CSV Report"):
             # Create CSV content
-            csv_content = generate_csv_report(results)
+            csv_content = b"".join(iter_csv_rows(results))
             st.download_button(
                 label="💾 Download Report.csv",
                 data=csv_content,
@@ -485,40 +508,94 @@ def display_results(results):
                 mime="text/csv"
             )
 
-def generate_csv_report(results):
-    """Generate CSV report from results"""
-    import csv
-    import io
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
-        'Question_Title', 'Subreddit', 'Score', 'Comments', 'Relevance_Score',
-        'Generated_Response', 'URL', 'Posted', 'Post_Status'
-    ])
-    
-    # Data rows
-    qa_pairs = results.get('question_answer_pairs', [])
-    posting_details = {d['question_id']: d for d in results.get('posting_results', {}).get('details', [])}
-    
-    for qa in qa_pairs:
-        posting_detail = posting_details.get(qa.get('id', ''), {})
-        
-        writer.writerow([
-            qa.get('title', ''),
-            qa.get('subreddit', ''),
-            qa.get('score', 0),
-            qa.get('num_comments', 0),
-            qa.get('relevance_score', 0),
-            qa.get('ai_response', ''),
-            qa.get('url', ''),
-            'Yes' if posting_detail.get('success') else 'No',
-            posting_detail.get('message', 'Not posted')
-        ])
+def render_posting_details(posting_results):
+    """Render per-question posting outcomes"""
+    with st.expander("📋 Posting Details", expanded=True):
+        for detail in posting_results['details']:
+            status_emoji = "✅" if detail['success'] else "❌"
+            st.write(f"{status_emoji} **{detail['question_title']}** (r/{detail['subreddit']})")
+            st.write(f"   {detail['message']}")
+            if detail.get('comment_url'):
+                st.write(f"   🔗 [View Comment]({detail['comment_url']})")
+
+def render_qa(i, qa):
+    """Render one question and its generated response"""
+    subreddit = qa.get('subreddit', 'unknown')
+    title = qa.get('title', 'Untitled')
+    selftext = qa.get('selftext', '')
+    relevance_score = qa.get('relevance_score')
+    url = qa.get('url')
     
-    return output.getvalue()
+    with st.expander(f"#{i} - r/{subreddit} - {title[:60]}..."):
+        
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.write("**Question Details:**")
+            st.write(f"**Subreddit:** r/{subreddit}")
+            st.write(f"**Score:** {qa.get('score', 0)} upvotes")
+            st.write(f"**Comments:** {qa.get('num_comments', 0)}")
+            
+            if relevance_score:
+                st.write(f"**Relevance:** {relevance_score:.2f}/1.0")
+            
+            if url:
+                st.write(f"🔗 [View Original]({url})")
+        
+        with col2:
+            st.write("**Original Question:**")
+            st.write(qa.get('title', 'N/A'))
+            
+            if selftext:
+                st.write("**Question Body:**")
+                st.write(selftext[:200] + "..." if len(selftext) > 200 else selftext)
+            
+            st.write("**Generated Response:**")
+            st.write(qa.get('ai_response', 'No response generated'))
+
+@st.cache_data(show_spinner=False)
+def create_json_export(results):
+    """Serialize results for download"""
+    if orjson is not None:
+        return orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(results, indent=2, default=str).encode('utf-8')
+
+def iter_csv_rows(results, chunk_size=500):
+    """Yield the CSV report for results as encoded chunks of rows"""
+    # Join questions with their posting outcome in one vectorized merge
+    qa_df = pd.DataFrame(
+        results.get('question_answer_pairs', []),
+        columns=['id', 'title', 'subreddit', 'score', 'num_comments', 'relevance_score', 'ai_response', 'url']
+    ).fillna({
+        'id': '', 'title': '', 'subreddit': '', 'score': 0, 'num_comments': 0,
+        'relevance_score': 0, 'ai_response': '', 'url': ''
+    })
+    details_df = pd.DataFrame(
+        results.get('posting_results', {}).get('details', []),
+        columns=['question_id', 'success', 'message']
+    ).drop_duplicates('question_id', keep='last').rename(columns={'question_id': 'id'})
+    merged = qa_df.merge(details_df, on='id', how='left')
+    
+    report = pd.DataFrame({
+        'Question_Title': merged['title'],
+        'Subreddit': merged['subreddit'],
+        'Score': merged['score'].astype('int64'),
+        'Comments': merged['num_comments'].astype('int64'),
+        'Relevance_Score': merged['relevance_score'],
+        'Generated_Response': merged['ai_response'],
+        'URL': merged['url'],
+        'Posted': np.where(merged['success'].fillna(False).astype(bool), 'Yes', 'No'),
+        'Post_Status': merged['message'].fillna('Not posted')
+    })
+    
+    # Header is written with the first chunk (or alone when there are no rows)
+    for start in range(0, max(len(report), 1), chunk_size):
+        chunk = report.iloc[start:start + chunk_size]
+        yield chunk.to_csv(index=False, header=start == 0, lineterminator='\r\n').encode('utf-8')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
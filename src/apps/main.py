@@ -5,8 +5,13 @@ Requires: pip install praw
 
 import praw
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
 import time
 
+# Redditors kept for reuse: at most this many, each for this many seconds (karma etc. go stale)
+REDDITOR_CACHE_SIZE = 256
+REDDITOR_CACHE_TTL = 300
+
 class RedditAPIClient:
     def __init__(self, client_id: str, client_secret: str, user_agent: str, 
                  username: str = None, password: str = None):
@@ -34,6 +39,9 @@ class RedditAPIClient:
                 client_secret=client_secret,
                 user_agent=user_agent
             )
+        
+        # (fetched_at, Redditor) by username, least recently used first, so /about is reused briefly
+        self._redditor_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
     # SUBREDDIT ENDPOINTS
     
@@ -185,7 +193,7 @@ class RedditAPIClient:
     
     def get_user_info(self, username: str) -> Dict[str, Any]:
         """Get user information"""
-        user = self.reddit.redditor(username)
+        user = self._get_redditor(username)
         return {
             'name': user.name,
             'created_utc': user.created_utc,
@@ -199,7 +207,7 @@ class RedditAPIClient:
     
     def get_user_posts(self, username: str, sort: str = 'new', limit: int = 25) -> List[Dict[str, Any]]:
         """Get user's posts"""
-        user = self.reddit.redditor(username)
+        user = self._get_redditor(username)
         posts = []
         if sort == 'new':
             submissions = user.submissions.new(limit=limit)
@@ -216,7 +224,7 @@ class RedditAPIClient:
     
     def get_user_comments(self, username: str, sort: str = 'new', limit: int = 25) -> List[Dict[str, Any]]:
         """Get user's comments"""
-        user = self.reddit.redditor(username)
+        user = self._get_redditor(username)
         comments = []
         if sort == 'new':
             user_comments = user.comments.new(limit=limit)
@@ -233,12 +241,12 @@ class RedditAPIClient:
     
     def follow_user(self, username: str):
         """Follow a user (requires authentication)"""
-        user = self.reddit.redditor(username)
+        user = self._get_redditor(username)
         user.friend()
     
     def unfollow_user(self, username: str):
         """Unfollow a user (requires authentication)"""
-        user = self.reddit.redditor(username)
+        user = self._get_redditor(username)
         user.unfriend()
 
     # SEARCH ENDPOINTS
@@ -269,7 +277,7 @@ class RedditAPIClient:
     
     def send_private_message(self, username: str, subject: str, message: str):
         """Send a private message (requires authentication)"""
-        self.reddit.redditor(username).message(subject, message)
+        self._get_redditor(username).message(subject, message)
     
     def get_inbox(self, limit: int = 25) -> List[Dict[str, Any]]:
         """Get inbox messages (requires authentication)"""
@@ -357,6 +365,21 @@ class RedditAPIClient:
 
     # HELPER METHODS
     
+    def _get_redditor(self, username: str):
+        """Return a recently cached Redditor so repeated lookups reuse fetched attributes"""
+        now = time.monotonic()
+        entry = self._redditor_cache.get(username)
+        if entry is not None and now - entry[0] < REDDITOR_CACHE_TTL:
+            self._redditor_cache.move_to_end(username)
+            return entry[1]
+        
+        user = self.reddit.redditor(username)
+        self._redditor_cache[username] = (now, user)
+        self._redditor_cache.move_to_end(username)
+        if len(self._redditor_cache) > REDDITOR_CACHE_SIZE:
+            self._redditor_cache.popitem(last=False)
+        return user
+    
     def _format_post(self, post) -> Dict[str, Any]:
         """Format a post object into a dictionary"""
         return {
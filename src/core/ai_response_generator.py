@@ -177,54 +177,63 @@ class AIResponseGenerator:
         self,
         questions: List[Dict[str, Any]],
         business_info: Dict[str, Any],
-        response_style: str = "Professional"
+        response_style: str = "Professional",
+        max_concurrency: int = 1
     ) -> List[Dict[str, Any]]:
-        """Generate responses for multiple questions"""
-        responses = []
+        """
+        Generate responses for multiple questions
         
+        Up to max_concurrency Gemini requests are in flight at once; results
+        are returned in the same order as the input questions.
+        """
         print(f"Generating {len(questions)} AI responses...")
         
-        for i, question in enumerate(questions, 1):
-            try:
-                print(f"Generating response {i}/{len(questions)}...")
-                
-                # Vary marketing approaches for diversity
-                marketing_approaches = [
-                    "casual recommendation if it fits naturally",
-                    "mention as one option among others", 
-                    "share personal experience using it",
-                    "only mention if directly relevant",
-                    "focus on helpful advice, mention tool if helpful"
-                ]
-                marketing_angle = random.choice(marketing_approaches)
-                
-                response = await self.generate_response(
-                    question_data=question,
-                    business_info=business_info,
-                    response_style=response_style,
-                    marketing_angle=marketing_angle
-                )
-                
-                # Add response to question data
-                question_with_response = question.copy()
-                question_with_response['ai_response'] = response
-                question_with_response['response_style'] = response_style
-                question_with_response['marketing_angle'] = marketing_angle
-                
-                responses.append(question_with_response)
-                
-                # Add delay to respect rate limits
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"Error generating response for question {i}: {str(e)}")
-                # Add question without response for completeness
-                question_with_response = question.copy()
-                question_with_response['ai_response'] = "Error generating response"
-                question_with_response['response_style'] = response_style
-                responses.append(question_with_response)
-        
-        return responses
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def generate_one(i: int, question: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    print(f"Generating response {i}/{len(questions)}...")
+                    
+                    # Vary marketing approaches for diversity
+                    marketing_approaches = [
+                        "casual recommendation if it fits naturally",
+                        "mention as one option among others", 
+                        "share personal experience using it",
+                        "only mention if directly relevant",
+                        "focus on helpful advice, mention tool if helpful"
+                    ]
+                    marketing_angle = random.choice(marketing_approaches)
+                    
+                    response = await self.generate_response(
+                        question_data=question,
+                        business_info=business_info,
+                        response_style=response_style,
+                        marketing_angle=marketing_angle
+                    )
+                    
+                    # Add response to question data
+                    question_with_response = question.copy()
+                    question_with_response['ai_response'] = response
+                    question_with_response['response_style'] = response_style
+                    question_with_response['marketing_angle'] = marketing_angle
+                    
+                    # Add delay to respect rate limits
+                    await asyncio.sleep(2)
+                    
+                    return question_with_response
+                    
+                except Exception as e:
+                    print(f"Error generating response for question {i}: {str(e)}")
+                    # Add question without response for completeness
+                    question_with_response = question.copy()
+                    question_with_response['ai_response'] = "Error generating response"
+                    question_with_response['response_style'] = response_style
+                    return question_with_response
+        
+        return list(await asyncio.gather(
+            *(generate_one(i, question) for i, question in enumerate(questions, 1))
+        ))
 
     def _get_style_guide(self, style: str) -> str:
         """Get style guide for the specified response style"""
@@ -7,16 +7,221 @@ import praw
 import asyncio
 from typing import List, Dict, Any, Optional
 import time
-from datetime import datetime, timedelta
 import re
 import random
+import json
+import sqlite3
+import contextlib
+import weakref
+from collections import Counter, namedtuple
+import numpy as np
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # Response caching is optional
+    CachedSession = None
+
+try:
+    import asyncpraw
+except ImportError:  # Listings fall back to blocking PRAW in worker threads
+    asyncpraw = None
+
+try:
+    from asyncio_throttle import Throttler
+except ImportError:  # Without it, prawcore's own pacing is all we have
+    Throttler = None
+
+# Outbound Reddit requests allowed per minute, just under the API's 60
+REDDIT_REQUESTS_PER_MINUTE = 55
+
+# The post fields we read; listings are reduced to these before scoring and caching
+CachedPost = namedtuple('CachedPost', [
+    'id', 'title', 'selftext', 'score', 'num_comments', 'created_utc',
+    'permalink', 'author', 'link_flair_text', 'is_self', 'over_18'
+])
+
+# Seconds a cached listing stays fresh, by listing type
+LISTING_TTLS = {'new': 300, 'hot': 900, 'rising': 300, 'search': 900}
+SUBREDDIT_INFO_TTL = 24 * 3600
+
+class ListingCache:
+    """Tiny SQLite store of JSON values with a freshness check on read"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS listings (key TEXT PRIMARY KEY, fetched_at REAL, value TEXT)"
+            )
+    
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Return the stored value if it is younger than ttl seconds"""
+        # One short-lived connection per call, so worker threads never share one
+        with sqlite3.connect(self.path, timeout=10) as conn:
+            row = conn.execute("SELECT fetched_at, value FROM listings WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] >= ttl:
+            return None
+        return json.loads(row[1])
+    
+    def set(self, key: str, value: Any) -> None:
+        with sqlite3.connect(self.path, timeout=10) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)", (key, time.time(), json.dumps(value))
+            )
+
+def _subreddit_info(subreddit) -> Dict[str, Any]:
+    """The subreddit fields we report, read off a PRAW subreddit"""
+    return {
+        'name': subreddit.display_name,
+        'title': subreddit.title,
+        'description': subreddit.description,
+        'subscribers': subreddit.subscribers,
+        'over18': subreddit.over18,
+        'created_utc': subreddit.created_utc,
+        'public_description': subreddit.public_description
+    }
+
+async def _close_on_shutdown(client):
+    """Stay suspended while the loop runs; loop.shutdown_asyncgens() (asyncio.run does it) closes the client"""
+    try:
+        yield
+    finally:
+        await client.close()
+
+def _to_cached_post(post) -> CachedPost:
+    """Read the fields we use off a PRAW submission, once"""
+    return CachedPost(
+        post.id, post.title, post.selftext, post.score, post.num_comments, post.created_utc,
+        post.permalink, str(post.author) if post.author else None, post.link_flair_text,
+        post.is_self, post.over_18
+    )
+
+# Industry words that pull in each default subreddit category (category names match themselves)
+_KEYWORD_TO_CATEGORY = {
+    'business': 'business', 'startup': 'business', 'company': 'business', 'service': 'business',
+    'technology': 'technology', 'tech': 'technology', 'software': 'technology', 'saas': 'technology',
+    'platform': 'technology', 'app': 'technology',
+    'productivity': 'productivity', 'efficiency': 'productivity', 'management': 'productivity',
+    'organization': 'productivity',
+    'ecommerce': 'ecommerce', 'retail': 'ecommerce', 'inventory': 'ecommerce', 'sales': 'ecommerce',
+    'commerce': 'ecommerce',
+    'finance': 'finance', 'health': 'health', 'education': 'education', 'general': 'general'
+}
+# Matches any of those words inside the industry text, longest first
+_CATEGORY_RE = re.compile("|".join(sorted(map(re.escape, _KEYWORD_TO_CATEGORY), key=len, reverse=True)))
+
+# Phrases that drive relevance scoring
+HIGH_VALUE_PATTERNS = (
+    'looking for', 'need help with', 'best tool for', 'recommend', 'suggestions for',
+    'what should i use', 'any good', 'help me find', 'trying to find',
+    'does anyone know', 'what do you use for', 'best way to'
+)
+PROBLEM_PATTERNS = (
+    'struggling with', 'having trouble', 'can\'t figure out', 'frustrated with',
+    'stuck on', 'difficult to', 'challenge with', 'issue with', 'problem with'
+)
+NEGATIVE_TERMS = (
+    'joke', 'meme', 'funny', 'lol', 'troll', 'shitpost', 'circlejerk',
+    'rant', 'venting', 'unpopular opinion', 'change my mind', 'roast me'
+)
+PROMO_INDICATORS = ('my product', 'our solution', 'check out', 'affiliate', 'discount code')
+
+def _phrase_regex(phrases) -> "re.Pattern":
+    """Compile literal phrases into one alternation, longest first"""
+    return re.compile("|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)))
+
+# Phrases that gate post quality
+SPAM_INDICATORS = (
+    'buy now', 'click here', 'limited time', 'act fast', 'guaranteed',
+    'make money fast', 'work from home', 'get rich', 'free money'
+)
+HELP_SEEKING_PATTERNS = (
+    '?', 'help', 'advice', 'recommend', 'suggest', 'looking for',
+    'need', 'how to', 'best way', 'what should', 'any ideas'
+)
+
+_HIGH_VALUE_RE = _phrase_regex(HIGH_VALUE_PATTERNS)
+_PROBLEM_RE = _phrase_regex(PROBLEM_PATTERNS)
+_NEGATIVE_RE = _phrase_regex(NEGATIVE_TERMS)
+_PROMO_RE = _phrase_regex(PROMO_INDICATORS)
+_SPAM_RE = _phrase_regex(SPAM_INDICATORS)
+_HELP_RE = _phrase_regex(HELP_SEEKING_PATTERNS)
+_WORD_RE = re.compile(r'\b\w+\b')
+_TOKEN_RE = re.compile(r'\b\w{3,}\b')
+_TOPIC_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+# Phrase scoring table for _score_text: (pattern, weight per distinct phrase in the post,
+# extra weight per distinct phrase that is also in the title)
+_RULES = (
+    (_HIGH_VALUE_RE, 0.8, 0.4),   # Direct problem/solution seeking (best marketing opportunities)
+    (_PROBLEM_RE, 0.6, 0.0),      # Problem descriptions (good opportunities)
+    (_NEGATIVE_RE, -0.5, 0.0),    # Jokes, memes and rants
+    (_PROMO_RE, -0.8, 0.0),       # Highly promotional posts (already solved)
+)
+
+def combine_scores(text_scores: np.ndarray, scores: np.ndarray, num_comments: np.ndarray,
+                   selftext_lens: np.ndarray, created_utc: np.ndarray, now_ts: float) -> np.ndarray:
+    """Add the engagement, length and recency terms to each post's text score, clipped to 0.0 - 3.0"""
+    # Post engagement quality (higher engagement = better opportunity), capped at 0.5
+    relevance = text_scores + np.minimum(scores * 0.01 + num_comments * 0.02, 0.5)
+    
+    # Post length quality: 50-500 chars is the sweet spot, longer is good but might be too long
+    relevance += np.where((selftext_lens >= 50) & (selftext_lens <= 500), 0.2,
+                          np.where(selftext_lens > 500, 0.1, 0.0))
+    
+    # Time sensitivity bonus (recent posts are better)
+    post_age_hours = (now_ts - created_utc) / 3600.0
+    relevance += np.where(post_age_hours < 24, 0.3, np.where(post_age_hours < 72, 0.1, 0.0))
+    
+    return np.minimum(np.maximum(relevance, 0.0), 3.0)
+
+# Weight of the normalized BM25 score added on top of the heuristic relevance score
+BM25_WEIGHT = 1.0
+
+def bm25_scores(documents: List[List[str]], query: List[str], k1: float = 1.2, b: float = 0.75) -> np.ndarray:
+    """Okapi BM25 score of every tokenized document against the query tokens"""
+    n = len(documents)
+    if n == 0 or not query:
+        return np.zeros(n)
+    
+    doc_len = np.fromiter((len(doc) for doc in documents), dtype=float, count=n)
+    avgdl = doc_len.mean() or 1.0
+    term_counts = [Counter(doc) for doc in documents]
+    tf = np.array([[counts[term] for term in query] for counts in term_counts], dtype=float)
+    
+    # IDF is computed once per query term for the whole corpus (the +1 keeps it non-negative)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log((n - df + 0.5) / (df + 0.5) + 1.0)
+    norm = k1 * (1 - b + b * doc_len / avgdl)
+    return (idf * tf * (k1 + 1) / (tf + norm[:, None])).sum(axis=1)
 
 class RedditAnalyzer:
-    def __init__(self, client_id: str, client_secret: str, user_agent: str = "RedditMarketingBot/1.0"):
-        """Initialize Reddit API client"""
+    def __init__(self, client_id: str, client_secret: str, user_agent: str = "RedditMarketingBot/1.0",
+                 cache_expire_after: int = 600, max_concurrent_subreddits: int = 4,
+                 listing_cache_path: Optional[str] = ".reddit_listings.sqlite"):
+        """
+        Initialize Reddit API client
+        
+        When requests-cache is installed, Reddit GET responses are cached on
+        disk for cache_expire_after seconds (0 disables the cache).
+        max_concurrent_subreddits caps how many subreddits are searched at once.
+        Reduced listings and subreddit info are also kept in listing_cache_path
+        (LISTING_TTLS / SUBREDDIT_INFO_TTL); None disables that cache.
+        """
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_agent = user_agent
+        self.max_concurrent_subreddits = max_concurrent_subreddits
+        self.listing_cache = ListingCache(listing_cache_path) if listing_cache_path else None
+        # One limiter for every Reddit call this analyzer makes, across subreddits and listings
+        self._throttler = Throttler(rate_limit=REDDIT_REQUESTS_PER_MINUTE, period=60) if Throttler else None
+        # asyncpraw clients, one per event loop (their aiohttp sessions can't cross loops),
+        # each paired with the _close_on_shutdown generator that closes it with its loop
+        self._async_clients = weakref.WeakKeyDictionary()
+        
+        requestor_kwargs = {}
+        if CachedSession is not None and cache_expire_after:
+            requestor_kwargs["session"] = CachedSession(".reddit_cache", expire_after=cache_expire_after)
         
         # Try to initialize PRAW, fall back to mock mode if credentials are invalid
         try:
@@ -24,6 +229,7 @@ class RedditAnalyzer:
                 client_id=client_id,
                 client_secret=client_secret,
                 user_agent=user_agent,
+                requestor_kwargs=requestor_kwargs,
                 check_for_async=False  # Suppress async warnings
             )
             # Test the connection
@@ -123,49 +329,72 @@ class RedditAnalyzer:
                 print("📋 Using mock data for demonstration (Reddit API not connected)")
                 # Filter and score mock questions based on business info
                 scored_questions = []
+                search_terms = self._generate_search_terms(business_info)
+                scoring_terms = self._prepare_scoring_terms(business_info)
                 for question in self.mock_questions:
                     # Calculate relevance score for mock questions
-                    search_terms = self._generate_search_terms(business_info)
-                    relevance_score = self._calculate_mock_relevance_score(question, search_terms, business_info)
+                    relevance_score = self._calculate_mock_relevance_score(
+                        question, search_terms, business_info, scoring_terms
+                    )
                     question['relevance_score'] = relevance_score
                     scored_questions.append(question)
                 
-                # Sort by relevance and return top questions
-                sorted_questions = sorted(scored_questions, key=lambda x: x.get('relevance_score', 0), reverse=True)
-                return sorted_questions[:max_questions]
+                # Sort by relevance (BM25 breaks ties) and return top questions
+                return self._rank_bm25(scored_questions, business_info)[:max_questions]
             
             # Get search parameters for real Reddit API
             subreddits = self._get_target_subreddits(business_info, subreddit_limit)
             search_terms = self._generate_search_terms(business_info)
+            scoring_terms = self._prepare_scoring_terms(business_info)
             
             all_questions = []
-            cutoff_date = datetime.now() - timedelta(days=days_back)
+            # Epoch-second floats, computed once: posts compare created_utc against them directly
+            now_ts = time.time()
+            cutoff_ts = now_ts - days_back * 86400
             
-            print(f"Searching {len(subreddits)} subreddits for relevant questions...")
-            
-            for subreddit_name in subreddits:
+            # Skip NSFW and inaccessible subreddits, looked up in one batched /api/info request
+            if not include_nsfw:
                 try:
-                    print(f"Searching r/{subreddit_name}...")
-                    questions = await self._search_subreddit(
-                        subreddit_name=subreddit_name,
-                        search_terms=search_terms,
-                        business_info=business_info,
-                        min_upvotes=min_upvotes,
-                        cutoff_date=cutoff_date,
-                        include_nsfw=include_nsfw
-                    )
-                    all_questions.extend(questions)
-                    
-                    # Add delay to respect rate limits
-                    await asyncio.sleep(1)
-                    
+                    infos = await self._praw_call(self.get_subreddit_infos, subreddits)
                 except Exception as e:
-                    print(f"Error searching r/{subreddit_name}: {str(e)}")
+                    # One failed batch shouldn't sink the search; look each subreddit up on its own
+                    print(f"⚠️  Batched subreddit lookup failed ({str(e)}), checking subreddits one by one")
+                    lookups = await asyncio.gather(*(
+                        self._praw_call(self.get_subreddit_info, name) for name in subreddits
+                    ))
+                    infos = {name: info for name, info in zip(subreddits, lookups) if info}
+                
+                skipped = [name for name in subreddits if name not in infos]
+                if skipped:
+                    print(f"⚠️  Skipping inaccessible subreddits: {skipped}")
+                subreddits = [name for name in subreddits if name in infos and not infos[name].get('over18')]
+            
+            print(f"Searching {len(subreddits)} subreddits for relevant questions...")
+            
+            # Search subreddits concurrently; the semaphore keeps us within Reddit's rate limits
+            semaphore = asyncio.Semaphore(self.max_concurrent_subreddits)
+            results = await asyncio.gather(*[
+                self._search_subreddit(
+                    subreddit_name=subreddit_name,
+                    search_terms=search_terms,
+                    business_info=business_info,
+                    min_upvotes=min_upvotes,
+                    cutoff_ts=cutoff_ts,
+                    scoring_terms=scoring_terms,
+                    semaphore=semaphore,
+                    now_ts=now_ts
+                )
+                for subreddit_name in subreddits
+            ], return_exceptions=True)
+            
+            for subreddit_name, questions in zip(subreddits, results):
+                if isinstance(questions, Exception):
+                    print(f"Error searching r/{subreddit_name}: {str(questions)}")
                     continue
+                all_questions.extend(questions)
             
-            # Sort by relevance score and return top questions
-            sorted_questions = sorted(all_questions, key=lambda x: x.get('relevance_score', 0), reverse=True)
-            return sorted_questions[:max_questions]
+            # Rank the candidates against the business terms as one corpus and return top questions
+            return self._rank_bm25(all_questions, business_info)[:max_questions]
             
         except Exception as e:
             print(f"Error in find_relevant_questions: {str(e)}")
@@ -173,36 +402,15 @@ class RedditAnalyzer:
 
     def _get_target_subreddits(self, business_info: Dict[str, Any], limit: int) -> List[str]:
         """Get target subreddits for searching"""
-        # Start with recommended subreddits from business analysis
-        target_subreddits = business_info.get('recommended_subreddits', [])
+        # Start with recommended subreddits from business analysis (copied; we extend it below)
+        target_subreddits = list(business_info.get('recommended_subreddits', []))
         
-        print(f"🔍 Debug: Initial subreddits from business analysis: {target_subreddits}")
-        
-        # Add category-specific subreddits based on industry
+        # Add category-specific subreddits based on industry, in one scan of the industry text
         industry = business_info.get('industry_category', '').lower()
-        keywords = [kw.lower() for kw in business_info.get('keywords', [])]
-        
-        print(f"🔍 Debug: Industry: {industry}")
-        print(f"🔍 Debug: Keywords: {keywords}")
-        
-        # Map industry and keywords to subreddit categories
+        matched = {_KEYWORD_TO_CATEGORY[word] for word in _CATEGORY_RE.findall(industry)}
         for category, subreddits in self.default_subreddits.items():
-            should_add = False
-            
-            if category in industry:
-                should_add = True
-            elif category == 'technology' and any(keyword in industry for keyword in ['tech', 'software', 'saas', 'platform', 'app']):
-                should_add = True
-            elif category == 'business' and any(keyword in industry for keyword in ['business', 'startup', 'company', 'service']):
-                should_add = True
-            elif category == 'productivity' and any(keyword in industry for keyword in ['productivity', 'efficiency', 'management', 'organization']):
-                should_add = True
-            elif category == 'ecommerce' and any(keyword in industry for keyword in ['retail', 'inventory', 'sales', 'commerce']):
-                should_add = True
-            
-            if should_add:
+            if category in matched:
                 target_subreddits.extend(subreddits)
-                print(f"🔍 Debug: Added {category} subreddits: {subreddits}")
         
         # If still no subreddits, add default business subreddits
         if not target_subreddits:
@@ -217,134 +425,150 @@ class RedditAnalyzer:
         
         return final_subreddits
 
-    def _search_subreddit_sync(
+    def _is_candidate(self, post: CachedPost, min_upvotes: int, cutoff_ts: float) -> bool:
+        """Check a listed post is recent enough and of good quality, before it is scored"""
+        return post.created_utc >= cutoff_ts and self._passes_quality(
+            post.title, post.selftext, post.score, post.is_self, min_upvotes
+        )
+
+    def _to_question(self, post: CachedPost, subreddit_name: str, search_method: str,
+                     relevance_score: float) -> Dict[str, Any]:
+        """Build the question dict for a scored post"""
+        return {
+            'id': post.id,
+            'title': post.title,
+            'selftext': post.selftext,
+            'subreddit': subreddit_name,
+            'score': post.score,
+            'num_comments': post.num_comments,
+            'created_utc': post.created_utc,
+            'url': f"https://reddit.com{post.permalink}",
+            'author': post.author or '[deleted]',
+            'relevance_score': relevance_score,
+            'search_method': search_method,
+            'flair': post.link_flair_text or None
+        }
+
+    async def _praw_call(self, fn, *args, **kwargs):
+        """Run a blocking PRAW call in a worker thread, paced by the shared rate limiter"""
+        async with self._throttler or contextlib.nullcontext():
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _async_reddit(self):
+        """asyncpraw client for the running event loop, created on first use and shared by its calls"""
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            client = asyncpraw.Reddit(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                user_agent=self.user_agent
+            )
+            closer = _close_on_shutdown(client)
+            await closer.asend(None)  # Registers it with the loop; see _close_on_shutdown
+            entry = self._async_clients[loop] = (client, closer)
+        return entry[0]
+
+    async def aclose(self) -> None:
+        """Close the asyncpraw client of the running event loop now, if one was opened"""
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    async def _fetch_posts(self, subreddit_name: str, method: str, limit: int, *args, **kwargs) -> List[CachedPost]:
+        """Fetch one listing (new/hot/rising/search), natively async when asyncpraw is installed"""
+        if asyncpraw is None:
+            return await self._praw_call(lambda: [
+                _to_cached_post(post)
+                for post in getattr(self.reddit.subreddit(subreddit_name), method)(*args, limit=limit, **kwargs)
+            ])
+        
+        reddit = await self._async_reddit()
+        subreddit = await reddit.subreddit(subreddit_name)
+        async with self._throttler or contextlib.nullcontext():
+            return [
+                _to_cached_post(post)
+                async for post in getattr(subreddit, method)(*args, limit=limit, **kwargs)
+            ]
+
+    async def _cached_listing(self, subreddit_name: str, method: str, limit: int, *args,
+                              ttl: Optional[float] = None, **kwargs) -> List[CachedPost]:
+        """Return a subreddit listing from the on-disk cache, fetching and storing it on a miss"""
+        # Every argument that shapes the listing goes in the key (kwargs sorted, e.g. sort/time_filter)
+        key = ":".join((
+            subreddit_name, method, *map(str, args),
+            *(f"{name}={value}" for name, value in sorted(kwargs.items())), str(limit)
+        ))
+        # SQLite calls block, so they run in worker threads to keep the loop free for other fetches
+        if self.listing_cache is not None:
+            rows = await asyncio.to_thread(self.listing_cache.get, key, ttl or LISTING_TTLS[method])
+            if rows is not None:
+                return [CachedPost(*row) for row in rows]
+        
+        # Only real fetches take a rate-limit slot
+        posts = await self._fetch_posts(subreddit_name, method, limit, *args, **kwargs)
+        if self.listing_cache is not None:
+            await asyncio.to_thread(self.listing_cache.set, key, posts)
+        return posts
+
+    async def _search_subreddit(
         self,
         subreddit_name: str,
         search_terms: List[str],
         business_info: Dict[str, Any],
         min_upvotes: int,
-        cutoff_date: datetime,
-        include_nsfw: bool
+        cutoff_ts: float,
+        scoring_terms: Optional[tuple] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        now_ts: Optional[float] = None
     ) -> List[Dict[str, Any]]:
-        """Synchronous helper to search a specific subreddit for relevant questions"""
+        """Search a specific subreddit for relevant questions"""
         questions = []
+        seen_ids: set = set()  # Posts already collected, across listings and searches
+        scoring_terms = scoring_terms or self._prepare_scoring_terms(business_info)
         
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            
-            # Skip NSFW subreddits if not included
-            if not include_nsfw and subreddit.over18:
-                return questions
-            
-            # Search recent posts
-            search_methods = [
-                ('new', subreddit.new(limit=100)),
-                ('hot', subreddit.hot(limit=50)),
-                ('rising', subreddit.rising(limit=25))
-            ]
-            
-            for method_name, posts in search_methods:
-                try:
+        async with semaphore or asyncio.Semaphore(1):
+            print(f"Searching r/{subreddit_name}...")
+            try:
+                # Recent posts plus searches on the top 3 search terms, all requested at once
+                terms = search_terms[:3]
+                listings = [
+                    ('new', self._cached_listing(subreddit_name, 'new', 100)),
+                    ('hot', self._cached_listing(subreddit_name, 'hot', 50)),
+                    ('rising', self._cached_listing(subreddit_name, 'rising', 25))
+                ] + [
+                    (f'search_{term}', self._cached_listing(
+                        subreddit_name, 'search', 20, term, sort='relevance', time_filter='month'
+                    ))
+                    for term in terms
+                ]
+                results = await asyncio.gather(*(listing for _, listing in listings), return_exceptions=True)
+                
+                # Process in the original order so earlier listings win duplicates
+                candidates = []
+                for (method_name, _), posts in zip(listings, results):
+                    if isinstance(posts, Exception):
+                        print(f"Error in search method {method_name}: {str(posts)}")
+                        continue
+                    
                     for post in posts:
-                        # Check if post is recent enough
-                        post_date = datetime.fromtimestamp(post.created_utc)
-                        if post_date < cutoff_date:
-                            continue
-                        
-                        # Enhanced filtering for quality posts
-                        if not self._is_quality_post(post, min_upvotes):
+                        # Listings overlap (new/hot/rising/search); keep the first copy
+                        if post.id in seen_ids or not self._is_candidate(post, min_upvotes, cutoff_ts):
                             continue
-                        
-                        # Calculate relevance score
-                        relevance_score = self._calculate_relevance_score(post, search_terms, business_info)
-                        
-                        if relevance_score > 0.5:  # Higher threshold for better quality
-                            question_data = {
-                                'id': post.id,
-                                'title': post.title,
-                                'selftext': post.selftext,
-                                'subreddit': subreddit_name,
-                                'score': post.score,
-                                'num_comments': post.num_comments,
-                                'created_utc': post.created_utc,
-                                'url': f"https://reddit.com{post.permalink}",
-                                'author': str(post.author) if post.author else '[deleted]',
-                                'relevance_score': relevance_score,
-                                'search_method': method_name,
-                                'flair': post.link_flair_text if post.link_flair_text else None
-                            }
-                            questions.append(question_data)
-                        
-                        # Respect rate limits
-                        time.sleep(0.1)
-                        
-                except Exception as e:
-                    print(f"Error in search method {method_name}: {str(e)}")
-                    continue
-            
-            # Also search with specific search terms
-            for term in search_terms[:3]:  # Limit to top 3 search terms
-                try:
-                    search_results = subreddit.search(term, sort='relevance', time_filter='month', limit=20)
-                    
-                    for post in search_results:
-                        post_date = datetime.fromtimestamp(post.created_utc)
-                        if (post_date >= cutoff_date and 
-                            self._is_quality_post(post, min_upvotes)):
-                            
-                            # Check if we already have this post
-                            if not any(q['id'] == post.id for q in questions):
-                                relevance_score = self._calculate_relevance_score(post, search_terms, business_info)
-                                
-                                if relevance_score > 0.5:
-                                    question_data = {
-                                        'id': post.id,
-                                        'title': post.title,
-                                        'selftext': post.selftext,
-                                        'subreddit': subreddit_name,
-                                        'score': post.score,
-                                        'num_comments': post.num_comments,
-                                        'created_utc': post.created_utc,
-                                        'url': f"https://reddit.com{post.permalink}",
-                                        'author': str(post.author) if post.author else '[deleted]',
-                                        'relevance_score': relevance_score,
-                                        'search_method': f'search_{term}',
-                                        'flair': post.link_flair_text if post.link_flair_text else None
-                                    }
-                                    questions.append(question_data)
-                    
-                    time.sleep(1)  # Rate limiting for search
-                    
-                except Exception as e:
-                    print(f"Error searching for term '{term}': {str(e)}")
-                    continue
-            
-        except Exception as e:
-            print(f"Error accessing subreddit r/{subreddit_name}: {str(e)}")
+                        seen_ids.add(post.id)
+                        candidates.append((post, method_name))
+                
+                # Score the subreddit's candidates as one batch
+                relevance = self._score_posts([post for post, _ in candidates], *scoring_terms, now_ts=now_ts)
+                for (post, method_name), relevance_score in zip(candidates, relevance.tolist()):
+                    if relevance_score > 0.5:  # Higher threshold for better quality
+                        questions.append(self._to_question(post, subreddit_name, method_name, relevance_score))
+                
+            except Exception as e:
+                print(f"Error accessing subreddit r/{subreddit_name}: {str(e)}")
         
         return questions
 
-    async def _search_subreddit(
-        self,
-        subreddit_name: str,
-        search_terms: List[str],
-        business_info: Dict[str, Any],
-        min_upvotes: int,
-        cutoff_date: datetime,
-        include_nsfw: bool
-    ) -> List[Dict[str, Any]]:
-        """Async wrapper for searching a specific subreddit"""
-        # Use asyncio.to_thread to run the synchronous PRAW code in a thread pool
-        return await asyncio.to_thread(
-            self._search_subreddit_sync,
-            subreddit_name,
-            search_terms,
-            business_info,
-            min_upvotes,
-            cutoff_date,
-            include_nsfw
-        )
-
     def _generate_search_terms(self, business_info: Dict[str, Any]) -> List[str]:
         """Generate marketing-focused search terms based on business information"""
         search_terms = []
@@ -398,248 +622,240 @@ class RedditAnalyzer:
         
         return cleaned_terms[:25]  # Increased limit for better coverage
 
-    def _calculate_relevance_score(self, post, search_terms: List[str], business_info: Dict[str, Any]) -> float:
-        """Calculate relevance score for a Reddit post with focus on marketing opportunities"""
-        score = 0.0
+    def _prepare_scoring_terms(self, business_info: Dict[str, Any]) -> tuple:
+        """Lowercase and tokenize business terms once per search, not once per post"""
+        pain_tokens = frozenset(
+            word
+            for pain_point in business_info.get('pain_points_solved', [])
+            for word in _WORD_RE.findall(pain_point.lower())
+            if len(word) > 3
+        )
+        keywords = tuple(
+            (keyword, ('for ' + keyword, keyword + ' tool', keyword + ' solution', 'good ' + keyword, 'best ' + keyword))
+            for keyword in (kw.lower() for kw in business_info.get('keywords', []))
+        )
+        return pain_tokens, keywords
+
+    def _rank_bm25(self, questions: List[Dict[str, Any]], business_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Add a normalized BM25 score (business keywords and pain points) to each question's relevance
+        and return the questions best first. Relevance is capped at 3.0, so BM25 also breaks the ties
+        between questions that reach the cap.
+        """
+        query = list(dict.fromkeys(
+            token
+            for text in (*business_info.get('keywords', []), *business_info.get('pain_points_solved', []))
+            for token in _TOKEN_RE.findall(text.lower())
+        ))
+        documents = [_TOKEN_RE.findall(f"{q['title']} {q['selftext']}".lower()) for q in questions]
+        scores = bm25_scores(documents, query)
+        if scores.size and scores.max() > 0:
+            scores = BM25_WEIGHT * scores / scores.max()
+            for question, bonus in zip(questions, scores.tolist()):
+                question['relevance_score'] = min(question['relevance_score'] + bonus, 3.0)
+        
+        ranked = sorted(zip(questions, scores.tolist()),
+                        key=lambda pair: (pair[0].get('relevance_score', 0), pair[1]), reverse=True)
+        return [question for question, _ in ranked]
+
+    def _score_posts(self, posts: List[CachedPost], pain_tokens: frozenset, keywords: tuple,
+                     now_ts: Optional[float] = None) -> np.ndarray:
+        """Score a batch of posts as marketing opportunities (0.0 - 3.0 each)"""
+        n = len(posts)
+        return combine_scores(
+            np.fromiter((self._text_score(p.title, p.selftext, pain_tokens, keywords) for p in posts), float, n),
+            np.fromiter((p.score for p in posts), float, n),
+            np.fromiter((p.num_comments for p in posts), float, n),
+            np.fromiter((len(p.selftext) for p in posts), float, n),
+            np.fromiter((p.created_utc for p in posts), float, n),
+            now_ts or time.time()
+        )
+
+    def _score_text(self, title: str, selftext: str, score: int, num_comments: int, created_utc: float,
+                    pain_tokens: frozenset, keywords: tuple, now_ts: Optional[float] = None) -> float:
+        """Score a post's text and stats as a marketing opportunity (0.0 - 3.0)"""
+        return float(combine_scores(
+            np.array([self._text_score(title, selftext, pain_tokens, keywords)]),
+            np.array([score], dtype=float),
+            np.array([num_comments], dtype=float),
+            np.array([len(selftext)], dtype=float),
+            np.array([created_utc], dtype=float),
+            now_ts or time.time()
+        )[0])
+
+    def _text_score(self, title: str, selftext: str, pain_tokens: frozenset, keywords: tuple) -> float:
+        """Score a post's title and text; combine_scores adds the engagement, length and recency terms"""
+        relevance = 0.0
         
         # Combine title and text for analysis
-        full_text = f"{post.title} {post.selftext}".lower()
-        title_text = post.title.lower()
-        
-        # HIGH VALUE: Direct problem/solution seeking (best marketing opportunities)
-        high_value_patterns = [
-            'looking for', 'need help with', 'best tool for', 'recommend', 'suggestions for',
-            'what should i use', 'any good', 'help me find', 'trying to find',
-            'does anyone know', 'what do you use for', 'best way to'
-        ]
-        for pattern in high_value_patterns:
-            if pattern in full_text:
-                score += 0.8
-                if pattern in title_text:  # Even higher if in title
-                    score += 0.4
-        
-        # MEDIUM VALUE: Problem descriptions (good opportunities)
-        problem_patterns = [
-            'struggling with', 'having trouble', 'can\'t figure out', 'frustrated with',
-            'stuck on', 'difficult to', 'challenge with', 'issue with', 'problem with'
-        ]
-        for pattern in problem_patterns:
-            if pattern in full_text:
-                score += 0.6
-        
-        # Pain point matching (very high weight for exact matches)
-        pain_points = business_info.get('pain_points_solved', [])
-        for pain_point in pain_points:
-            pain_words = re.findall(r'\b\w+\b', pain_point.lower())
-            for word in pain_words:
-                if len(word) > 3 and word in full_text:
-                    score += 0.5
-                    if word in title_text:
-                        score += 0.3  # Bonus for title matches
+        title_text = title.lower()
+        full_text = f"{title_text} {selftext.lower()}"
+        
+        # Phrase rules (see _RULES): each distinct phrase counts once, title hits add a bonus
+        for pattern, weight, title_weight in _RULES:
+            hits = set(pattern.findall(full_text))
+            if hits:
+                relevance += weight * len(hits)
+                if title_weight:
+                    relevance += title_weight * len(hits.intersection(pattern.findall(title_text)))
+        
+        # Pain point matching (very high weight for exact word matches)
+        if pain_tokens:
+            matched = pain_tokens.intersection(_WORD_RE.findall(full_text))
+            relevance += 0.5 * len(matched)
+            if matched:  # Bonus for title matches
+                relevance += 0.3 * len(matched.intersection(_WORD_RE.findall(title_text)))
         
         # Keyword matching with context awareness
-        keywords = [kw.lower() for kw in business_info.get('keywords', [])]
-        for keyword in keywords:
+        for keyword, contexts in keywords:
             if keyword in full_text:
-                score += 0.4
+                relevance += 0.4
                 # Check if keyword appears in problem-seeking context
-                context_indicators = ['for ' + keyword, keyword + ' tool', keyword + ' solution', 
-                                    'good ' + keyword, 'best ' + keyword]
-                for context in context_indicators:
+                for context in contexts:
                     if context in full_text:
-                        score += 0.3
-        
-        # Post engagement quality (higher engagement = better opportunity)
-        engagement_score = (post.score * 0.01) + (post.num_comments * 0.02)
-        score += min(engagement_score, 0.5)  # Cap engagement bonus
-        
-        # Post length quality (substantial posts are better)
-        if 50 <= len(post.selftext) <= 500:  # Sweet spot for detailed but not overwhelming
-            score += 0.2
-        elif len(post.selftext) > 500:
-            score += 0.1  # Good but might be too long
-        
-        # Time sensitivity bonus (recent posts are better)
-        post_age_hours = (datetime.now().timestamp() - post.created_utc) / 3600
-        if post_age_hours < 24:
-            score += 0.3
-        elif post_age_hours < 72:
-            score += 0.1
-        
-        # NEGATIVE indicators (reduce score significantly)
-        negative_terms = [
-            'joke', 'meme', 'funny', 'lol', 'troll', 'shitpost', 'circlejerk',
-            'rant', 'venting', 'unpopular opinion', 'change my mind', 'roast me'
-        ]
-        for term in negative_terms:
-            if term in full_text:
-                score -= 0.5
-        
-        # Avoid highly promotional posts (already solved)
-        promo_indicators = ['my product', 'our solution', 'check out', 'affiliate', 'discount code']
-        for indicator in promo_indicators:
-            if indicator in full_text:
-                score -= 0.8
+                        relevance += 0.3
         
         # Bonus for specific, actionable questions
-        if '?' in post.title:  # Direct questions are great
-            score += 0.2
+        if '?' in title:  # Direct questions are great
+            relevance += 0.2
         
-        # Normalize and return score
-        return max(0.0, min(score, 3.0))
+        return relevance
+
+    def _calculate_relevance_score(self, post, search_terms: List[str], business_info: Dict[str, Any],
+                                   scoring_terms: Optional[tuple] = None) -> float:
+        """Calculate relevance score for a Reddit post with focus on marketing opportunities"""
+        pain_tokens, keywords = scoring_terms or self._prepare_scoring_terms(business_info)
+        return self._score_text(post.title, post.selftext, post.score, post.num_comments, post.created_utc,
+                                pain_tokens, keywords)
     
-    def _calculate_mock_relevance_score(self, question: Dict[str, Any], search_terms: List[str], business_info: Dict[str, Any]) -> float:
+    def _calculate_mock_relevance_score(self, question: Dict[str, Any], search_terms: List[str], business_info: Dict[str, Any],
+                                        scoring_terms: Optional[tuple] = None) -> float:
         """Calculate relevance score for mock questions"""
-        score = 0.0
-        
-        # Combine title and text for analysis
-        full_text = f"{question['title']} {question['selftext']}".lower()
-        title_text = question['title'].lower()
-        
-        # Check for high-value patterns
-        high_value_patterns = [
-            'looking for', 'need help with', 'best tool for', 'recommend', 'suggestions for',
-            'what should i use', 'any good', 'help me find', 'trying to find'
-        ]
-        for pattern in high_value_patterns:
-            if pattern in full_text:
-                score += 0.8
-                if pattern in title_text:
-                    score += 0.4
-        
-        # Pain point matching
-        pain_points = business_info.get('pain_points_solved', [])
-        for pain_point in pain_points:
-            pain_words = re.findall(r'\b\w+\b', pain_point.lower())
-            for word in pain_words:
-                if len(word) > 3 and word in full_text:
-                    score += 0.5
-                    if word in title_text:
-                        score += 0.3
-        
-        # Keyword matching
-        keywords = [kw.lower() for kw in business_info.get('keywords', [])]
-        for keyword in keywords:
-            if keyword in full_text:
-                score += 0.4
+        pain_tokens, keywords = scoring_terms or self._prepare_scoring_terms(business_info)
+        score = self._score_text(question['title'], question['selftext'], question['score'],
+                                 question['num_comments'], question['created_utc'], pain_tokens, keywords)
         
         # Base score for mock questions (they're pre-selected to be relevant)
-        score += 0.6
-        
-        return max(0.0, min(score, 3.0))
+        return min(score + 0.6, 3.0)
+
+    def _mock_subreddit_info(self, subreddit_name: str) -> Dict[str, Any]:
+        """Mock subreddit info for when the Reddit API is not available"""
+        return {
+            'name': subreddit_name,
+            'title': f"r/{subreddit_name}",
+            'description': f"Mock description for r/{subreddit_name}",
+            'subscribers': 100000,
+            'over18': False,
+            'created_utc': 1640995200,
+            'public_description': f"A community for {subreddit_name} discussions"
+        }
 
     def get_subreddit_info(self, subreddit_name: str) -> Dict[str, Any]:
         """Get information about a specific subreddit"""
         if self.use_mock_data:
-            # Return mock subreddit info
-            return {
-                'name': subreddit_name,
-                'title': f"r/{subreddit_name}",
-                'description': f"Mock description for r/{subreddit_name}",
-                'subscribers': 100000,
-                'over18': False,
-                'created_utc': 1640995200,
-                'public_description': f"A community for {subreddit_name} discussions"
-            }
+            return self._mock_subreddit_info(subreddit_name)
         
         try:
             if not self.reddit:
                 return {}
-            subreddit = self.reddit.subreddit(subreddit_name)
-            return {
-                'name': subreddit.display_name,
-                'title': subreddit.title,
-                'description': subreddit.description,
-                'subscribers': subreddit.subscribers,
-                'over18': subreddit.over18,
-                'created_utc': subreddit.created_utc,
-                'public_description': subreddit.public_description
-            }
+            
+            key = f"about:{subreddit_name}"
+            if self.listing_cache is not None:
+                info = self.listing_cache.get(key, SUBREDDIT_INFO_TTL)
+                if info is not None:
+                    return info
+            
+            info = _subreddit_info(self.reddit.subreddit(subreddit_name))
+            if self.listing_cache is not None:
+                self.listing_cache.set(key, info)
+            return info
         except Exception as e:
             print(f"Error getting subreddit info for r/{subreddit_name}: {str(e)}")
             return {}
 
+    def get_subreddit_infos(self, subreddit_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get information about many subreddits, batching uncached ones through
+        /api/info (100 names per request). Inaccessible subreddits are left out.
+        """
+        if self.use_mock_data:
+            return {name: self._mock_subreddit_info(name) for name in subreddit_names}
+        if not self.reddit:
+            return {}
+        
+        infos = {}
+        missing = {}  # lowercase name -> requested name
+        for name in subreddit_names:
+            cached = self.listing_cache.get(f"about:{name}", SUBREDDIT_INFO_TTL) if self.listing_cache else None
+            if cached is not None:
+                infos[name] = cached
+            else:
+                missing[name.lower()] = name
+        
+        names = list(missing.values())
+        for start in range(0, len(names), 100):
+            for subreddit in self.reddit.info(subreddits=names[start:start + 100]):
+                name = missing.get(subreddit.display_name.lower(), subreddit.display_name)
+                infos[name] = _subreddit_info(subreddit)
+                if self.listing_cache is not None:
+                    self.listing_cache.set(f"about:{name}", infos[name])
+        
+        return infos
+
     def validate_subreddits(self, subreddit_names: List[str]) -> List[str]:
         """Validate that subreddits exist and are accessible"""
-        valid_subreddits = []
+        try:
+            infos = self.get_subreddit_infos(subreddit_names)
+        except Exception as e:
+            print(f"Could not validate subreddits: {str(e)}")
+            return []
         
         for name in subreddit_names:
-            try:
-                subreddit = self.reddit.subreddit(name)
-                # Try to access a property to validate
-                _ = subreddit.subscribers
-                valid_subreddits.append(name)
-            except Exception as e:
-                print(f"Subreddit r/{name} is not accessible: {str(e)}")
-                continue
-        
-        return valid_subreddits
+            if name not in infos:
+                print(f"Subreddit r/{name} is not accessible")
+        return [name for name in subreddit_names if name in infos]
 
     async def get_trending_topics(self, subreddit_names: List[str]) -> Dict[str, List[str]]:
         """Get trending topics from specified subreddits"""
-        trending_topics = {}
+        semaphore = asyncio.Semaphore(self.max_concurrent_subreddits)
         
-        for subreddit_name in subreddit_names:
+        async def topics_for(subreddit_name: str) -> List[str]:
             try:
-                subreddit = self.reddit.subreddit(subreddit_name)
-                hot_posts = list(subreddit.hot(limit=25))
+                async with semaphore:
+                    posts = await self._cached_listing(subreddit_name, 'hot', 25)
+                titles = [post.title.lower() for post in posts]
                 
-                # Extract common words from titles
-                titles = [post.title.lower() for post in hot_posts]
-                all_words = []
-                for title in titles:
-                    words = re.findall(r'\b\w+\b', title)
-                    all_words.extend([w for w in words if len(w) > 3])
-                
-                # Count word frequency
-                word_count = {}
-                for word in all_words:
-                    word_count[word] = word_count.get(word, 0) + 1
-                
-                # Get top trending words
-                trending_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-                trending_topics[subreddit_name] = [word for word, count in trending_words[:10]]
-                
-                await asyncio.sleep(1)  # Rate limiting
+                # Count words of 4+ letters across titles; most_common avoids a full sort
+                counter = Counter(word for title in titles for word in _TOPIC_WORD_RE.findall(title))
+                return [word for word, _ in counter.most_common(10)]
                 
             except Exception as e:
                 print(f"Error getting trending topics for r/{subreddit_name}: {str(e)}")
-                trending_topics[subreddit_name] = []
+                return []
         
-        return trending_topics
+        topics = await asyncio.gather(*(topics_for(name) for name in subreddit_names))
+        return dict(zip(subreddit_names, topics))
     
     def _is_quality_post(self, post, min_upvotes: int) -> bool:
         """Check if post meets quality criteria for marketing opportunities"""
+        return self._passes_quality(post.title, post.selftext, post.score, post.is_self, min_upvotes)
+    
+    def _passes_quality(self, title: str, selftext: str, score: int, is_self: bool, min_upvotes: int) -> bool:
+        """Quality criteria on already-extracted post fields, cheapest checks first"""
         # Basic requirements
-        if (post.score < min_upvotes or 
-            not post.is_self or  # Only self posts (text posts)
-            len(post.selftext) < 20):  # Must have substantial text
+        if (score < min_upvotes or 
+            not is_self or  # Only self posts (text posts)
+            len(selftext) < 20):  # Must have substantial text
             return False
         
-        # Check for spam indicators
-        full_text = f"{post.title} {post.selftext}".lower()
-        spam_indicators = [
-            'buy now', 'click here', 'limited time', 'act fast', 'guaranteed',
-            'make money fast', 'work from home', 'get rich', 'free money'
-        ]
-        for spam in spam_indicators:
-            if spam in full_text:
-                return False
-        
         # Avoid deleted/removed content
-        if post.selftext in ['[deleted]', '[removed]', '']:
-            return False
-        
-        # Avoid posts that are too short or too long
-        if len(post.selftext) > 2000:  # Probably too long for good engagement
+        if selftext in ('[deleted]', '[removed]'):
             return False
         
-        # Must be seeking help/advice/recommendations
-        help_seeking_patterns = [
-            '?', 'help', 'advice', 'recommend', 'suggest', 'looking for',
-            'need', 'how to', 'best way', 'what should', 'any ideas'
-        ]
-        if not any(pattern in full_text for pattern in help_seeking_patterns):
+        # Avoid posts that are too long
+        if len(selftext) > 2000:  # Probably too long for good engagement
             return False
         
-        return True
+        # No spam indicators, and must be seeking help/advice/recommendations
+        full_text = f"{title} {selftext}".lower()
+        return _SPAM_RE.search(full_text) is None and _HELP_RE.search(full_text) is not None
@@ -318,14 +318,18 @@ class RedditPoster:
         except Exception as e:
             print(f"❌ Error saving posting history: {str(e)}")
     
+    def set_posting_history(self, history: List[Dict[str, Any]]):
+        """Replace the posting history (e.g. with one loaded elsewhere)"""
+        self.posting_history = history
+        # Rebuild posted_questions set
+        self.posted_questions = {post['question_id'] for post in self.posting_history}
+    
     def load_posting_history(self, filepath: str = "posting_history.json"):
         """Load posting history from file"""
         try:
             if os.path.exists(filepath):
                 with open(filepath, 'r') as f:
-                    self.posting_history = json.load(f)
-                # Rebuild posted_questions set
-                self.posted_questions = {post['question_id'] for post in self.posting_history}
+                    self.set_posting_history(json.load(f))
                 print(f"✅ Loaded {len(self.posting_history)} posts from history")
             else:
                 print("ℹ️  No posting history file found, starting fresh")
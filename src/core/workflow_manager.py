@@ -32,13 +32,15 @@ class WorkflowState(TypedDict):
 
 class WorkflowManager:
     def __init__(self, gemini_api_key: str, reddit_client_id: str, reddit_client_secret: str, 
-                 reddit_username: Optional[str] = None, reddit_password: Optional[str] = None):
+                 reddit_username: Optional[str] = None, reddit_password: Optional[str] = None,
+                 max_concurrent_requests: int = 3):
         """Initialize the workflow manager with required API keys"""
         self.gemini_api_key = gemini_api_key
         self.reddit_client_id = reddit_client_id
         self.reddit_client_secret = reddit_client_secret
         self.reddit_username = reddit_username
         self.reddit_password = reddit_password
+        self.max_concurrent_requests = max_concurrent_requests
         
         # Initialize components
         self.business_analyzer = BusinessAnalyzer(gemini_api_key)
@@ -91,7 +93,8 @@ class WorkflowManager:
         min_upvotes: int = 5,
         days_back: int = 7,
         auto_post: bool = False,
-        dry_run: bool = True
+        dry_run: bool = True,
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Run the complete Reddit marketing workflow
@@ -106,6 +109,8 @@ class WorkflowManager:
             days_back: How many days back to search
             auto_post: Whether to automatically post responses to Reddit
             dry_run: If True, simulate posting without actually posting
+            max_concurrency: Concurrent response generations for this run
+                (defaults to max_concurrent_requests)
             
         Returns:
             Complete workflow results
@@ -125,7 +130,8 @@ class WorkflowManager:
                 "min_upvotes": min_upvotes,
                 "days_back": days_back,
                 "auto_post": auto_post,
-                "dry_run": dry_run
+                "dry_run": dry_run,
+                "max_concurrency": max_concurrency or self.max_concurrent_requests
             },
             "current_step": "starting",
             "error_messages": [],
@@ -235,7 +241,8 @@ class WorkflowManager:
             generated_responses = await self.response_generator.generate_multiple_responses(
                 questions=state["reddit_questions"],
                 business_info=state["business_analysis"],
-                response_style=state["workflow_config"]["response_style"]
+                response_style=state["workflow_config"]["response_style"],
+                max_concurrency=state["workflow_config"]["max_concurrency"]
             )
             
             state["generated_responses"] = generated_responses
@@ -253,7 +253,7 @@ def test_imports():
     modules_to_test = [
         ('streamlit', 'Streamlit UI framework'),
         ('pandas', 'Data manipulation'),
-        ('PyPDF2', 'PDF processing'),
+        ('pypdf', 'PDF processing'),
         ('praw', 'Reddit API'),
         ('google.generativeai', 'Google Gemini API'),
         ('langchain', 'LangChain framework'),
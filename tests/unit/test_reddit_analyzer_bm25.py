@@ -0,0 +1,27 @@
+"""
+Unit tests for the BM25 re-ranking helper
+Run with: python -m pytest tests/unit
+"""
+
+import os
+import sys
+
+# reddit_analyzer is imported directly, so these tests don't need the AI dependencies
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src', 'core'))
+
+from reddit_analyzer import bm25_scores
+
+def test_bm25_ranks_matching_documents_first():
+    documents = [
+        ['inventory', 'tracking', 'tool', 'for', 'stock'],
+        ['weekend', 'hiking', 'photos'],
+        ['inventory', 'spreadsheet', 'help'],
+    ]
+    scores = bm25_scores(documents, ['inventory', 'tracking'])
+    
+    assert list(scores.argsort()[::-1]) == [0, 2, 1]
+    assert scores[1] == 0.0
+
+def test_bm25_handles_empty_inputs():
+    assert bm25_scores([], ['inventory']).size == 0
+    assert list(bm25_scores([['inventory']], [])) == [0.0]
@@ -0,0 +1,82 @@
+"""
+Unit tests for the Reddit listing cache
+Run with: python -m pytest tests/unit
+"""
+
+import asyncio
+import os
+import sys
+
+# reddit_analyzer is imported directly, so these tests don't need the AI dependencies
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src', 'core'))
+
+import reddit_analyzer
+from reddit_analyzer import CachedPost, ListingCache, RedditAnalyzer
+
+SAMPLE_POST = CachedPost(
+    id='abc123',
+    title='Looking for an inventory tool?',
+    selftext='We keep running out of stock and need help with tracking.',
+    score=12,
+    num_comments=4,
+    created_utc=1700000000.0,
+    permalink='/r/smallbusiness/comments/abc123/',
+    author='shopowner',
+    link_flair_text=None,
+    is_self=True,
+    over_18=False
+)
+
+def make_analyzer(tmp_path):
+    """Analyzer with a fresh listing cache and no Reddit client"""
+    analyzer = RedditAnalyzer.__new__(RedditAnalyzer)
+    analyzer.listing_cache = ListingCache(str(tmp_path / "listings.sqlite"))
+    analyzer._throttler = None
+    analyzer.fetches = []
+    
+    async def fake_fetch(subreddit_name, method, limit, *args, **kwargs):
+        analyzer.fetches.append((subreddit_name, method, limit, args, kwargs))
+        return [SAMPLE_POST]
+    
+    analyzer._fetch_posts = fake_fetch
+    return analyzer
+
+def test_listing_cache_miss_returns_none(tmp_path):
+    cache = ListingCache(str(tmp_path / "listings.sqlite"))
+    assert cache.get("python:new:100", 300) is None
+
+def test_listing_cache_hit_within_ttl(tmp_path):
+    cache = ListingCache(str(tmp_path / "listings.sqlite"))
+    cache.set("python:new:100", {"posts": [1, 2, 3]})
+    assert cache.get("python:new:100", 300) == {"posts": [1, 2, 3]}
+
+def test_listing_cache_expires_after_ttl(tmp_path, monkeypatch):
+    cache = ListingCache(str(tmp_path / "listings.sqlite"))
+    monkeypatch.setattr(reddit_analyzer.time, "time", lambda: 1000.0)
+    cache.set("python:new:100", ["post"])
+    
+    monkeypatch.setattr(reddit_analyzer.time, "time", lambda: 1299.0)
+    assert cache.get("python:new:100", 300) == ["post"]
+    monkeypatch.setattr(reddit_analyzer.time, "time", lambda: 1300.0)
+    assert cache.get("python:new:100", 300) is None
+
+def test_cached_post_round_trip(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    
+    first = asyncio.run(analyzer._cached_listing('smallbusiness', 'new', 100))
+    second = asyncio.run(analyzer._cached_listing('smallbusiness', 'new', 100))
+    
+    # The second call is served from SQLite and comes back as equal CachedPost tuples
+    assert len(analyzer.fetches) == 1
+    assert first == second == [SAMPLE_POST]
+    assert isinstance(second[0], CachedPost)
+    assert second[0].title == SAMPLE_POST.title
+
+def test_cached_listing_key_includes_kwargs(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    
+    asyncio.run(analyzer._cached_listing('smallbusiness', 'search', 20, 'inventory', sort='relevance', time_filter='month'))
+    asyncio.run(analyzer._cached_listing('smallbusiness', 'search', 20, 'inventory', sort='relevance', time_filter='month'))
+    asyncio.run(analyzer._cached_listing('smallbusiness', 'search', 20, 'inventory', sort='new', time_filter='month'))
+    
+    assert [fetch[4]['sort'] for fetch in analyzer.fetches] == ['relevance', 'new']